@@ -15,17 +15,37 @@ The 7 Analyzers:
 """
 
 import os
+import re
 import sys
-import json
-import subprocess
+import hashlib
 import logging
+import threading
+from bisect import bisect_left
+from collections import OrderedDict
+from contextlib import contextmanager
 from pathlib import Path
-from datetime import datetime
-from typing import Dict, Any, List, Optional
-from dataclasses import dataclass, field
+from typing import Dict, Any, Hashable, Iterable, Iterator, List, Optional, Set, Tuple
+from dataclasses import dataclass, field, fields, replace
 
 logger = logging.getLogger(__name__)
 
+# Prefer a C JSON parser for analyzer reports when one is installed
+try:
+    import orjson as _fast_json
+except ImportError:
+    try:
+        import ujson as _fast_json
+    except ImportError:
+        _fast_json = None
+
+
+def _loads_json(data):
+    """Parse JSON text or bytes, using orjson/ujson when available."""
+    if _fast_json is not None:
+        return _fast_json.loads(data)
+    import json
+    return json.loads(data)
+
 
 def _discover_connascence_path() -> Optional[Path]:
     """
@@ -55,6 +75,7 @@ def _discover_connascence_path() -> Optional[Path]:
 
     for config_path in mcp_config_paths:
         if config_path.exists():
+            import json
             try:
                 with open(config_path) as f:
                     config = json.load(f)
@@ -122,9 +143,14 @@ CONNASCENCE_PROJECT = _discover_connascence_path() or Path(".")
 CONNASCENCE_VENV = CONNASCENCE_PROJECT / "venv-connascence" if CONNASCENCE_PROJECT.exists() else Path(".")
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ConnascenceResult:
-    """Result from connascence analysis."""
+    """
+    Result from connascence analysis.
+
+    Immutable and slotted: one is built per analyzed file, and frozen
+    instances can be shared from the result caches without copying.
+    """
     success: bool
     sigma_level: float = 0.0
     dpmo: float = 0.0
@@ -139,24 +165,26 @@ class ConnascenceResult:
 
     def passes_gate(self, strict: bool = False) -> bool:
         """Check if result passes quality gate."""
-        if not self.success:
-            return False
-
-        if strict:
-            return (
-                self.sigma_level >= 4.0 and
-                self.dpmo <= 6210 and
-                self.nasa_compliance >= 0.95 and
-                self.mece_score >= 0.80 and
-                self.theater_risk < 0.20 and
-                self.critical_violations == 0
-            )
-        else:
-            # Lenient mode - just check critical violations
-            return self.critical_violations == 0
+        passes_strict, passes_lenient = self._gates()
+        return passes_strict if strict else passes_lenient
+
+    def _gates(self) -> Tuple[bool, bool]:
+        """Evaluate (strict, lenient) gates together; strict implies lenient."""
+        # Lenient mode - just check critical violations
+        lenient = self.success and self.critical_violations == 0
+        strict = (
+            lenient and
+            self.sigma_level >= 4.0 and
+            self.dpmo <= 6210 and
+            self.nasa_compliance >= 0.95 and
+            self.mece_score >= 0.80 and
+            self.theater_risk < 0.20
+        )
+        return strict, lenient
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for storage."""
+        passes_strict, passes_lenient = self._gates()
         return {
             "success": self.success,
             "sigma_level": self.sigma_level,
@@ -167,12 +195,685 @@ class ConnascenceResult:
             "clarity_score": self.clarity_score,
             "violations_count": self.violations_count,
             "critical_violations": self.critical_violations,
-            "passes_strict": self.passes_gate(strict=True),
-            "passes_lenient": self.passes_gate(strict=False),
+            "passes_strict": passes_strict,
+            "passes_lenient": passes_lenient,
             "error": self.error,
         }
 
 
+_MAGIC_NUMBER_RE = re.compile(r'\b\d{3,}\b')
+
+# Byte-level equivalents for scanning ASCII buffers without decoding
+_MAGIC_NUMBER_BYTES_RE = re.compile(rb'\b\d{3,}\b')
+_DEF_BYTES_RE = re.compile(rb'def ')
+_BARE_EXCEPT_BYTES_RE = re.compile(rb'except:')
+_GOTO_BYTES_RE = re.compile(rb'goto', re.IGNORECASE)
+# Bytes that text-mode decoding would alter (non-ASCII, CR translation)
+_NEEDS_DECODE_BYTES_RE = re.compile(rb'[\x80-\xff\r]')
+# What str.lstrip() strips within ASCII; bytes.lstrip() omits \x1c-\x1f
+_ASCII_WHITESPACE = b" \t\n\x0b\x0c\r\x1c\x1d\x1e\x1f"
+
+# Upper DPMO bound for each sigma level; anything above the last is 0 sigma
+_DPMO_THRESHOLDS = (3.4, 233, 6210, 66807, 308538, 691462)
+_SIGMA_LEVELS = (6.0, 5.0, 4.0, 3.0, 2.0, 1.0, 0.0)
+
+# Substrings whose presence suggests placeholder ("theater") code. "..."
+# only counts alongside a "def ", so it is checked separately.
+_THEATER_MARKERS = ("TODO", "FIXME", "pass  # ", "raise NotImplementedError")
+# Substrings flagged by the NASA safety heuristics ("goto" is matched
+# case-insensitively and bare excepts by count, so both are separate).
+_NASA_MARKERS = ("eval(", "exec(")
+
+# Directories with at least this many .py files are scanned on a process
+# pool in mock mode; below it, pool startup costs more than it saves.
+_PARALLEL_SCAN_MIN_FILES = 64
+
+# The scan pool is shared by every bridge in the process, so per-call
+# bridges (quality_gate, analyze_artifact) do not start one each. Once it
+# fails (e.g. BrokenProcessPool, or a spawn-start importer without an
+# `if __name__ == "__main__":` guard), scans stay serial for the process.
+# Workers are capped and never forked from this (threaded) process: they
+# come from a forkserver where available, else spawn, and the pool is
+# shut down at exit.
+_SCAN_POOL_MAX_WORKERS = 4
+_scan_pool = None
+_scan_pool_failed = False
+_SCAN_POOL_LOCK = threading.Lock()
+
+# Files at least this large are scanned through mmap (or line by line when
+# they need decoding) in mock mode instead of being read into one string.
+_STREAM_MIN_BYTES = 1_000_000
+_READ_CHUNK_BYTES = 1 << 20
+
+# ASCII content at least this long has its line statistics computed with
+# numpy (imported lazily, optional) instead of a per-line Python loop.
+_VECTORIZE_MIN_CHARS = 65_536
+_VECTORIZE_MAX_ROUNDS = 64
+_numpy = None
+_ascii_space = None
+
+_SYS_PATH_LOCK = threading.Lock()
+
+
+@contextmanager
+def _temporary_sys_path(path: Path):
+    """
+    Prepend path to sys.path for the duration of the block.
+
+    The analyzer package has submodules, so a plain spec_from_file_location
+    import is not enough; instead the entry is removed again on exit so the
+    process-wide import search path does not grow with every bridge.
+    """
+    entry = str(path)
+    with _SYS_PATH_LOCK:
+        added = entry not in sys.path
+        if added:
+            sys.path.insert(0, entry)
+    try:
+        yield
+    finally:
+        if added:
+            with _SYS_PATH_LOCK:
+                try:
+                    sys.path.remove(entry)
+                except ValueError:
+                    pass
+
+
+class _LRUCache:
+    """Small thread-safe LRU cache mapping hashable keys to ConnascenceResults."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Hashable, ConnascenceResult]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[ConnascenceResult]:
+        with self._lock:
+            result = self._data.get(key)
+            if result is None:
+                return None
+            self._data.move_to_end(key)
+            return result
+
+    def put(self, key: Hashable, result: ConnascenceResult) -> None:
+        with self._lock:
+            self._data[key] = result
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+# Heuristic estimates keyed by (content digest, policy). Identical files
+# (vendored copies, boilerplate __init__.py) are only scanned once per process.
+_ESTIMATE_CACHE = _LRUCache(maxsize=4096)
+
+
+def _content_digest(content: str) -> bytes:
+    """Return a short BLAKE2b digest of text content for cache keys."""
+    return hashlib.blake2b(
+        content.encode("utf-8", "surrogatepass"), digest_size=16
+    ).digest()
+
+
+# Full analysis results keyed by (mode, path fingerprint, policy). Lets a
+# Ralph loop re-check an unchanged artifact without re-running the analyzer.
+_ANALYSIS_CACHE = _LRUCache(maxsize=512)
+
+
+def _iter_python_files(root: Path) -> Iterator[os.DirEntry]:
+    """
+    Yield a DirEntry for every .py file under root.
+
+    An iterative os.scandir walk: names are filtered on the DirEntry without
+    building Path objects or stat-ing non-matching entries. Symlinked
+    directories are not followed, so link cycles cannot recurse forever.
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.endswith(".py"):
+                        yield entry
+        except OSError:
+            continue
+
+
+def _path_fingerprint(path: Path) -> Optional[bytes]:
+    """
+    Fingerprint a file or directory for the analysis cache.
+
+    Files are keyed by a digest of their bytes. Directories are keyed by the
+    sorted (path, mtime_ns, size) of their .py files, which is cheap
+    to collect and changes whenever any analyzed file does.
+
+    Returns None when the path cannot be fingerprinted (e.g. missing).
+    """
+    try:
+        if path.is_file():
+            digest = hashlib.blake2b(digest_size=16)
+            with open(path, "rb") as f:
+                for chunk in iter(lambda: f.read(_READ_CHUNK_BYTES), b""):
+                    digest.update(chunk)
+            return digest.digest()
+        if path.is_dir():
+            entries = []
+            for entry in _iter_python_files(path):
+                stat = entry.stat()
+                entries.append((entry.path, stat.st_mtime_ns, stat.st_size))
+            entries.sort()
+            return hashlib.blake2b(repr(entries).encode(), digest_size=16).digest()
+    except OSError:
+        pass
+    return None
+
+
+def _read_small_file(path: Path) -> Optional[bytes]:
+    """
+    Bytes of a regular file smaller than _STREAM_MIN_BYTES.
+
+    None for directories, large files (which are streamed instead) and
+    unreadable paths.
+    """
+    try:
+        if not path.is_file():
+            return None
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size >= _STREAM_MIN_BYTES:
+                return None
+            return f.read()
+    except OSError:
+        return None
+
+
+def _stat_stamp(path: Path) -> Optional[List[int]]:
+    """
+    Cheap stat-only stamp for the persistent result store.
+
+    [max mtime_ns, file count, total size] over the file itself or every
+    .py file under a directory. Any edit, addition or removal changes it
+    without reading file contents. Returns None for missing paths.
+    """
+    try:
+        if path.is_file():
+            stat = path.stat()
+            return [stat.st_mtime_ns, 1, stat.st_size]
+        if path.is_dir():
+            newest = count = total = 0
+            for entry in _iter_python_files(path):
+                stat = entry.stat()
+                newest = max(newest, stat.st_mtime_ns)
+                count += 1
+                total += stat.st_size
+            return [newest, count, total]
+    except OSError:
+        pass
+    return None
+
+
+class _ResultStore:
+    """
+    Results persisted across processes in a JSON file (e.g.
+    .loop/cache/connascence.json), validated by _stat_stamp.
+
+    raw_output is not persisted: direct-mode violations are arbitrary
+    analyzer objects, and stored results only need the metrics. At most
+    maxsize entries are kept; the least recently written are dropped first.
+    """
+
+    def __init__(self, path: Path, maxsize: int = 512):
+        self.path = Path(path)
+        self.maxsize = maxsize
+        self._entries: Optional[Dict[str, Any]] = None
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    def _load(self) -> Dict[str, Any]:
+        if self._entries is None:
+            try:
+                entries = _loads_json(self.path.read_bytes())
+                self._entries = entries if isinstance(entries, dict) else {}
+            except (OSError, ValueError):
+                self._entries = {}
+        return self._entries
+
+    def get(self, key: str, stamp: List[int]) -> Optional[ConnascenceResult]:
+        with self._lock:
+            entry = self._load().get(key)
+        if not entry or entry.get("stamp") != stamp:
+            return None
+        try:
+            return ConnascenceResult(**entry["result"])
+        except (KeyError, TypeError):
+            return None
+
+    def put(self, key: str, stamp: List[int], result: ConnascenceResult) -> None:
+        stored = {f.name: getattr(result, f.name) for f in fields(result) if f.name != "raw_output"}
+        with self._lock:
+            entries = self._load()
+            # Re-inserting moves the key to the end, so iteration order is
+            # oldest write first
+            entries.pop(key, None)
+            entries[key] = {"stamp": stamp, "result": stored}
+            while len(entries) > self.maxsize:
+                del entries[next(iter(entries))]
+            self._dirty = True
+
+    def save(self) -> None:
+        """Write pending entries atomically (temp file + os.replace)."""
+        import json
+
+        with self._lock:
+            if not self._dirty:
+                return
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+                tmp_path.write_text(json.dumps(self._entries), encoding="utf-8")
+                os.replace(tmp_path, self.path)
+                self._dirty = False
+            except OSError as e:
+                logger.debug(f"Could not write connascence cache {self.path}: {e}")
+
+
+def _get_numpy():
+    """Import numpy on first use; None when it is not installed."""
+    global _numpy
+    if _numpy is None:
+        try:
+            import numpy
+            _numpy = numpy
+        except ImportError:
+            _numpy = False
+    return _numpy or None
+
+
+def _ascii_space_table(np):
+    """Lookup table of bytes that str.isspace() treats as whitespace, minus newline."""
+    global _ascii_space
+    if _ascii_space is None:
+        table = np.zeros(256, dtype=bool)
+        table[[0x09, 0x0B, 0x0C, 0x0D, 0x1C, 0x1D, 0x1E, 0x1F, 0x20]] = True
+        _ascii_space = table
+    return _ascii_space
+
+
+def _ascii_line_stats(np, data) -> Tuple[int, int, int]:
+    """
+    Return (line count, lines over 120 chars, max leading whitespace) for
+    an ASCII buffer (bytes or mmap), without copying it.
+
+    For ASCII, bytes and characters coincide, so the results match the
+    per-line str loop in _line_shape_stats exactly.
+    """
+    buf = np.frombuffer(data, dtype=np.uint8)
+    newlines = np.flatnonzero(buf == 0x0A)
+    starts = np.concatenate(([0], newlines + 1))
+    ends = np.append(newlines, buf.size)
+    long_lines = int(((ends - starts) > 120).sum())
+
+    # Advance every line start through its leading whitespace in lockstep;
+    # the number of rounds before all runs end is the maximum indent.
+    is_space = _ascii_space_table(np)
+    max_indent = 0
+    positions = starts[starts < buf.size]
+    while positions.size:
+        positions = positions[is_space[buf[positions]]]
+        if not positions.size:
+            break
+        max_indent += 1
+        if max_indent == _VECTORIZE_MAX_ROUNDS:
+            # Pathologically deep whitespace: measure the few survivors directly
+            for start in (positions - (max_indent - 1)).tolist():
+                end = int(ends[np.searchsorted(ends, start)])
+                line = bytes(data[start:end]).decode("ascii")
+                max_indent = max(max_indent, len(line) - len(line.lstrip()))
+            break
+        positions = positions + 1
+        positions = positions[positions < buf.size]
+    return len(starts), long_lines, max_indent
+
+
+def _line_shape_stats(content: str) -> Tuple[int, int, int]:
+    """
+    Return (line count, lines over 120 chars, max leading whitespace).
+
+    Large ASCII content is measured with numpy over the encoded buffer
+    instead of slicing and stripping every line in Python.
+    """
+    np = _get_numpy() if len(content) >= _VECTORIZE_MIN_CHARS and content.isascii() else None
+    if np is not None:
+        return _ascii_line_stats(np, content.encode("ascii"))
+
+    lines = content.split("\n")
+    long_lines = 0
+    max_indent = 0
+    for line in lines:
+        length = len(line)
+        if length > 120:
+            long_lines += 1
+        indent = length - len(line.lstrip())
+        if indent > max_indent:
+            max_indent = indent
+    return len(lines), long_lines, max_indent
+
+
+def _indicators_from_stats(
+    line_count: int,
+    long_lines: int,
+    max_indent: int,
+    magic_numbers: int,
+    function_count: int,
+) -> int:
+    """Combine raw counts into the violation indicator score."""
+    # Long lines (>120 chars) and magic numbers
+    indicators = long_lines + magic_numbers
+
+    # Deep nesting
+    if max_indent > 20:
+        indicators += max_indent // 4
+
+    # Long functions (estimate)
+    if function_count > 0:
+        avg_lines_per_function = line_count / function_count
+        if avg_lines_per_function > 50:
+            indicators += int(avg_lines_per_function / 50)
+
+    return indicators
+
+
+def _count_violation_indicators(content: str) -> int:
+    """Count potential violation indicators in content."""
+    line_count, long_lines, max_indent = _line_shape_stats(content)
+    return _indicators_from_stats(
+        line_count,
+        long_lines,
+        max_indent,
+        len(_MAGIC_NUMBER_RE.findall(content)),
+        content.count("def "),
+    )
+
+
+def _scan_python_file(path: str) -> Tuple[int, int]:
+    """
+    Return (line count, violation indicators) for one file.
+
+    Module-level so it can run in a process pool. Unreadable files count
+    as (0, 0), matching the serial scan which skips them.
+    """
+    try:
+        content = Path(path).read_text(errors="ignore")
+    except Exception:
+        return 0, 0
+    return len(content.split("\n")), _count_violation_indicators(content)
+
+
+def _get_scan_pool():
+    """Return the shared scan pool, starting it on first use; None once failed."""
+    global _scan_pool
+    with _SCAN_POOL_LOCK:
+        if _scan_pool is None and not _scan_pool_failed:
+            import atexit
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+
+            methods = multiprocessing.get_all_start_methods()
+            context = multiprocessing.get_context(
+                "forkserver" if "forkserver" in methods else "spawn"
+            )
+            _scan_pool = ProcessPoolExecutor(
+                max_workers=min(_SCAN_POOL_MAX_WORKERS, os.cpu_count() or 1),
+                mp_context=context,
+            )
+            atexit.register(_shutdown_scan_pool)
+        return _scan_pool
+
+
+def _shutdown_scan_pool() -> None:
+    """Shut down the shared scan pool, if started (registered with atexit)."""
+    global _scan_pool
+    with _SCAN_POOL_LOCK:
+        pool, _scan_pool = _scan_pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _discard_scan_pool() -> None:
+    """Shut down the shared scan pool and stop using one in this process."""
+    global _scan_pool_failed
+    _scan_pool_failed = True
+    _shutdown_scan_pool()
+
+
+def _stream_estimate_counts(path: Path) -> Tuple[int, int, int, int]:
+    """
+    Heuristic counts for a large file, read one line at a time.
+
+    Produces the same (total_lines, violations, theater_indicators,
+    nasa_violations) as the in-memory estimate without holding the whole
+    file as a string. Every marker is newline-free, so per-line checks
+    match whole-content checks.
+    """
+    total_lines = 1
+    long_lines = 0
+    max_indent = 0
+    magic_numbers = 0
+    function_count = 0
+    bare_excepts = 0
+    seen = set()
+    markers = _THEATER_MARKERS + _NASA_MARKERS + ("...",)
+
+    # Same decoding and newline handling as Path.read_text(errors="ignore")
+    with open(path, errors="ignore") as f:
+        for line in f:
+            if line.endswith("\n"):
+                total_lines += 1
+                line = line[:-1]
+            length = len(line)
+            if length > 120:
+                long_lines += 1
+            indent = length - len(line.lstrip())
+            if indent > max_indent:
+                max_indent = indent
+            magic_numbers += len(_MAGIC_NUMBER_RE.findall(line))
+            function_count += line.count("def ")
+            bare_excepts += line.count("except:")
+            for marker in markers:
+                if marker not in seen and marker in line:
+                    seen.add(marker)
+            if "goto" not in seen and "goto" in line.lower():
+                seen.add("goto")
+
+    violations = _indicators_from_stats(
+        total_lines, long_lines, max_indent, magic_numbers, function_count
+    )
+    theater_indicators = sum(marker in seen for marker in _THEATER_MARKERS)
+    theater_indicators += "..." in seen and function_count > 0
+    nasa_violations = sum(marker in seen for marker in _NASA_MARKERS)
+    nasa_violations += ("goto" in seen) + (bare_excepts > 2)
+    return total_lines, violations, theater_indicators, nasa_violations
+
+
+def _bytes_line_stats(data: bytes) -> Tuple[int, int, int]:
+    """Pure-Python _line_shape_stats for an ASCII bytes buffer."""
+    lines = data.split(b"\n")
+    long_lines = 0
+    max_indent = 0
+    for line in lines:
+        length = len(line)
+        if length > 120:
+            long_lines += 1
+        indent = length - len(line.lstrip(_ASCII_WHITESPACE))
+        if indent > max_indent:
+            max_indent = indent
+    return len(lines), long_lines, max_indent
+
+
+def _buffer_estimate_counts(data, np=None) -> Tuple[int, int, int, int]:
+    """
+    Heuristic counts for an ASCII, CR-free buffer (bytes or mmap).
+
+    Works on the raw bytes with no decode or copy. Under those conditions
+    the bytes are exactly what Path.read_text() would return, so the counts
+    match the in-memory estimate. Line statistics use numpy when given.
+    """
+    if np is not None:
+        line_count, long_lines, max_indent = _ascii_line_stats(np, data)
+    else:
+        line_count, long_lines, max_indent = _bytes_line_stats(data)
+    function_count = len(_DEF_BYTES_RE.findall(data))
+    violations = _indicators_from_stats(
+        line_count,
+        long_lines,
+        max_indent,
+        len(_MAGIC_NUMBER_BYTES_RE.findall(data)),
+        function_count,
+    )
+
+    theater_indicators = sum(data.find(m.encode()) != -1 for m in _THEATER_MARKERS)
+    theater_indicators += data.find(b"...") != -1 and function_count > 0
+    nasa_violations = sum(data.find(m.encode()) != -1 for m in _NASA_MARKERS)
+    nasa_violations += _GOTO_BYTES_RE.search(data) is not None
+    nasa_violations += len(_BARE_EXCEPT_BYTES_RE.findall(data)) > 2
+    return line_count, violations, theater_indicators, nasa_violations
+
+
+def _mmap_estimate_counts(path: Path) -> Optional[Tuple[int, int, int, int]]:
+    """
+    Heuristic counts for a large file, scanned through a read-only mmap.
+
+    Returns None when the fast path does not apply (numpy missing, or the
+    file has non-ASCII bytes or carriage returns that text decoding would
+    change); callers then fall back to _stream_estimate_counts.
+    """
+    import mmap
+
+    np = _get_numpy()
+    if np is None:
+        return None
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # Empty files cannot be mapped
+            return None
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if _NEEDS_DECODE_BYTES_RE.search(mm):
+                return None
+            return _buffer_estimate_counts(mm, np)
+
+
+# (interpreter, cwd) pairs whose CLI has no working --serve-stdio. Bridges
+# are often built per call, so this is remembered per process rather than
+# per bridge to avoid paying a failed worker start on every analysis.
+_WORKER_UNSUPPORTED: Set[Tuple[str, str]] = set()
+
+
+# Error prefix on successful mock results that stood in for a failed CLI run
+_FALLBACK_PREFIX = "fallback: "
+
+
+def _is_cacheable(result: ConnascenceResult) -> bool:
+    """
+    Whether a result may be cached as the answer for its mode.
+
+    Failures may be transient, and mock fallbacks are not what the CLI
+    would have answered, so both are retried on the next call.
+    """
+    return result.success and not (result.error or "").startswith(_FALLBACK_PREFIX)
+
+
+def _is_cli_report(output: Any) -> bool:
+    """True when a worker reply looks like an analysis report, not an error."""
+    return (
+        isinstance(output, dict)
+        and not output.get("error")
+        and output.get("success", True) is not False
+    )
+
+
+class _AnalyzerWorker:
+    """
+    Long-lived connascence CLI process speaking JSON lines over stdio.
+
+    Each request is one JSON object per line on stdin ({"path", "policy"});
+    the worker answers with one JSON line on stdout in the same format as
+    `connascence analyze --format json`. This amortizes interpreter startup
+    and analyzer import across all files analyzed by a bridge.
+    """
+
+    def __init__(self, cmd: List[str], cwd: str, timeout: float = 60):
+        import queue
+        import subprocess
+
+        self._timeout = timeout
+        self._lock = threading.Lock()
+        self._responses: "queue.Queue[Optional[str]]" = queue.Queue()
+        self._process = subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            bufsize=1,
+            cwd=cwd,
+        )
+        # Pipes cannot be polled portably (Windows), so a daemon thread
+        # turns stdout into a queue that supports read timeouts.
+        threading.Thread(target=self._read_responses, daemon=True).start()
+
+    def _read_responses(self) -> None:
+        for line in self._process.stdout:
+            self._responses.put(line)
+        self._responses.put(None)
+
+    @property
+    def alive(self) -> bool:
+        return self._process.poll() is None
+
+    def request(self, path: Path, policy: str) -> Dict[str, Any]:
+        """Send one analysis request and wait for its response."""
+        return self.request_many([path], policy)[0]
+
+    def request_many(self, paths: List[Path], policy: str) -> List[Dict[str, Any]]:
+        """
+        Send a batch of analysis requests and wait for all responses.
+
+        Requests are pipelined: every line is written before the first
+        response is read, so the worker never idles between files.
+        """
+        import json
+
+        with self._lock:
+            self._process.stdin.write("".join(
+                json.dumps({"path": str(path), "policy": policy}) + "\n" for path in paths
+            ))
+            self._process.stdin.flush()
+            lines = []
+            for _ in paths:
+                line = self._responses.get(timeout=self._timeout)
+                if line is None:
+                    raise EOFError("Analyzer worker exited")
+                lines.append(line)
+        return [_loads_json(line) for line in lines]
+
+    def close(self) -> None:
+        """Terminate the worker process."""
+        if not self.alive:
+            return
+        try:
+            self._process.stdin.close()
+            self._process.terminate()
+            self._process.wait(timeout=5)
+        except Exception:
+            self._process.kill()
+
+
 class ConnascenceBridge:
     """
     Bridge to invoke Connascence Analyzer from cognitive architecture.
@@ -183,18 +884,33 @@ class ConnascenceBridge:
     3. MCP tool call (if connascence MCP server running)
     """
 
-    def __init__(self, connascence_path: Optional[Path] = None):
+    def __init__(self, connascence_path: Optional[Path] = None, cache_path: Optional[Path] = None):
+        """
+        Args:
+            connascence_path: Connascence project root (auto-discovered by default)
+            cache_path: Optional JSON file (e.g. .loop/cache/connascence.json)
+                where results persist across runs; unchanged paths are then
+                not re-analyzed by later processes either
+        """
         self.connascence_path = connascence_path or CONNASCENCE_PROJECT
+        self._store = (
+            _ResultStore(cache_path, maxsize=_ANALYSIS_CACHE.maxsize) if cache_path else None
+        )
         self.venv_path = self.connascence_path / "venv-connascence"
+        # Resolved once; every CLI invocation reuses the same command prefix
+        self._python = self._python_executable()
+        self._cli_prefix = [self._python, "-m", "connascence"]
         self._analyzer = None
+        self._worker: Optional[_AnalyzerWorker] = None
+        self._worker_key = (self._python, str(self.connascence_path))
         self._mode = self._detect_mode()
 
     def _detect_mode(self) -> str:
         """Detect which invocation mode to use."""
         # Try direct import first (use project root, not src folder)
         try:
-            sys.path.insert(0, str(self.connascence_path))
-            from analyzer.connascence_analyzer import ConnascenceAnalyzer
+            with _temporary_sys_path(self.connascence_path):
+                from analyzer.connascence_analyzer import ConnascenceAnalyzer
             self._analyzer = ConnascenceAnalyzer
             return "direct"
         except ImportError:
@@ -219,12 +935,7 @@ class ConnascenceBridge:
         Returns:
             ConnascenceResult with quality metrics
         """
-        if self._mode == "direct":
-            return self._analyze_direct(file_path, policy)
-        elif self._mode == "cli":
-            return self._analyze_cli(file_path, policy)
-        else:
-            return self._analyze_mock(file_path, policy)
+        return self.analyze_paths([file_path], policy)[0]
 
     def analyze_directory(self, dir_path: Path, policy: str = "standard") -> ConnascenceResult:
         """
@@ -237,17 +948,134 @@ class ConnascenceBridge:
         Returns:
             ConnascenceResult with aggregated quality metrics
         """
+        return self.analyze_paths([dir_path], policy)[0]
+
+    def analyze_paths(
+        self,
+        paths: Iterable[Path],
+        policy: str = "standard",
+        workers: int = 4,
+    ) -> List[ConnascenceResult]:
+        """
+        Analyze many files and/or directories in one batch.
+
+        Unchanged inputs come from the analysis cache. The rest are handed
+        to the analyzer together: pipelined through one CLI worker, run on
+        a single analyzer instance in direct mode, or, for CLIs without a
+        worker, as concurrent one-shot subprocesses.
+
+        Args:
+            paths: Files or directories to analyze
+            policy: Analysis policy
+            workers: Maximum concurrent one-shot CLI subprocesses
+
+        Returns:
+            List of ConnascenceResult, aligned with paths
+        """
+        paths = [Path(p) for p in paths]
+        keys: List[Optional[Hashable]] = []
+        stamps: List[Optional[List[int]]] = []
+        results: List[Optional[ConnascenceResult]] = []
+        prefetched: List[Optional[Tuple[bytes, bytes]]] = []
+        pending: List[int] = []
+        for index, path in enumerate(paths):
+            cached = None
+            key = None
+            contents = None
+            stamp = _stat_stamp(path) if self._store is not None else None
+            if stamp is not None:
+                cached = self._store.get(self._store_key(path, policy), stamp)
+            if cached is None:
+                # Mock analysis reads small files whole anyway, so read them
+                # once here and hand the bytes and digest on to it
+                data = _read_small_file(path) if self._mode == "mock" else None
+                if data is not None:
+                    fingerprint = hashlib.blake2b(data, digest_size=16).digest()
+                    contents = (data, fingerprint)
+                else:
+                    fingerprint = _path_fingerprint(path)
+                if fingerprint is not None:
+                    key = (self._mode, str(path.absolute()), fingerprint, policy)
+                    cached = _ANALYSIS_CACHE.get(key)
+            keys.append(key)
+            stamps.append(stamp)
+            results.append(cached)
+            prefetched.append(contents if cached is None else None)
+            if cached is None:
+                pending.append(index)
+
+        if pending:
+            fresh = self._analyze_batch(
+                [paths[i] for i in pending], policy, workers, [prefetched[i] for i in pending]
+            )
+            for index, result in zip(pending, fresh):
+                results[index] = result
+                if not _is_cacheable(result):
+                    continue
+                if keys[index] is not None:
+                    _ANALYSIS_CACHE.put(keys[index], result)
+                if stamps[index] is not None:
+                    self._store.put(self._store_key(paths[index], policy), stamps[index], result)
+            if self._store is not None:
+                self._store.save()
+        return results
+
+    def _store_key(self, path: Path, policy: str) -> str:
+        """Key for the persistent result store."""
+        return f"{self._mode}|{policy}|{path.absolute()}"
+
+    def _analyze_batch(
+        self,
+        paths: List[Path],
+        policy: str,
+        workers: int = 1,
+        prefetched: Optional[List[Optional[Tuple[bytes, bytes]]]] = None,
+    ) -> List[ConnascenceResult]:
+        """
+        Analyze several paths, sharing per-invocation setup where the mode allows.
+
+        prefetched optionally aligns (bytes, digest) pairs with paths for
+        files already read by the caller; only mock analysis uses them.
+        """
         if self._mode == "direct":
-            return self._analyze_direct(dir_path, policy)
+            with _temporary_sys_path(self.connascence_path):
+                try:
+                    analyzer = self._analyzer()
+                except Exception as e:
+                    logger.error(f"Direct analysis failed: {e}")
+                    return [ConnascenceResult(success=False, error=str(e)) for _ in paths]
+                return [self._run_direct_analysis(path, policy, analyzer) for path in paths]
         elif self._mode == "cli":
-            return self._analyze_cli(dir_path, policy)
+            return self._analyze_cli_batch(paths, policy, workers)
         else:
-            return self._analyze_mock(dir_path, policy)
+            prefetched = prefetched or [None] * len(paths)
+            return [self._analyze(path, policy, contents) for path, contents in zip(paths, prefetched)]
+
+    def _analyze(
+        self,
+        path: Path,
+        policy: str,
+        prefetched: Optional[Tuple[bytes, bytes]] = None,
+    ) -> ConnascenceResult:
+        """Dispatch to the detected invocation mode."""
+        if self._mode == "direct":
+            return self._analyze_direct(path, policy)
+        elif self._mode == "cli":
+            return self._analyze_cli(path, policy)
+        else:
+            return self._analyze_mock(path, policy, prefetched)
 
-    def _analyze_direct(self, path: Path, policy: str) -> ConnascenceResult:    
+    def _analyze_direct(self, path: Path, policy: str) -> ConnascenceResult:
         """Analyze using direct Python import."""
+        # The analyzer may import sibling modules lazily while it runs
+        with _temporary_sys_path(self.connascence_path):
+            return self._run_direct_analysis(path, policy)
+
+    def _run_direct_analysis(self, path: Path, policy: str, analyzer: Any = None) -> ConnascenceResult:
+        """Run the imported analyzer (or a shared instance) over a file or directory."""
         try:
-            analyzer = self._analyzer()
+            if analyzer is None:
+                analyzer = self._analyzer()
             violations: List[Any] = []
             total_lines = 0
 
@@ -275,9 +1103,10 @@ class ConnascenceBridge:
                 )
 
             if path.is_dir():
-                for file_path in path.rglob("*.py"):
-                    if not file_path.is_file():
+                for entry in _iter_python_files(path):
+                    if not entry.is_file():
                         continue
+                    file_path = Path(entry.path)
                     violations.extend(analyzer.analyze_file(file_path))
                     total_lines += count_lines(file_path)
             else:
@@ -308,17 +1137,98 @@ class ConnascenceBridge:
             logger.error(f"Direct analysis failed: {e}")
             return ConnascenceResult(success=False, error=str(e))
 
+    def _python_executable(self) -> str:
+        """Python interpreter used to run the connascence CLI."""
+        python_path = self.venv_path / "Scripts" / "python.exe"
+        if python_path.exists():
+            return str(python_path)
+        return "python"
+
+    def _get_worker(self) -> Optional[_AnalyzerWorker]:
+        """Return a running analyzer worker, starting one on first use."""
+        if self._worker_key in _WORKER_UNSUPPORTED:
+            return None
+        if self._worker is None or not self._worker.alive:
+            try:
+                self._worker = _AnalyzerWorker(
+                    self._cli_prefix + ["--serve-stdio"],
+                    cwd=str(self.connascence_path),
+                )
+            except OSError as e:
+                logger.debug(f"Could not start analyzer worker: {e}")
+                _WORKER_UNSUPPORTED.add(self._worker_key)
+                return None
+        return self._worker
+
+    def close(self) -> None:
+        """Stop the persistent analyzer worker, if started."""
+        if self._worker is not None:
+            self._worker.close()
+            self._worker = None
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+    def _result_from_cli_output(self, output: Dict[str, Any]) -> ConnascenceResult:
+        """Build a result from the CLI's JSON report."""
+        return ConnascenceResult(
+            success=True,
+            sigma_level=output.get("sigma_level", 0.0),
+            dpmo=output.get("dpmo", 0.0),
+            nasa_compliance=output.get("nasa_compliance", 0.0),
+            mece_score=output.get("mece_score", 0.0),
+            theater_risk=output.get("theater_risk", 0.0),
+            clarity_score=output.get("clarity_score", 0.0),
+            violations_count=output.get("total_violations", 0),
+            critical_violations=output.get("critical_violations", 0),
+            raw_output=output,
+        )
+
     def _analyze_cli(self, path: Path, policy: str) -> ConnascenceResult:
-        """Analyze using CLI subprocess."""
+        """Analyze using the persistent CLI worker, else a one-shot subprocess."""
+        return self._analyze_cli_batch([path], policy)[0]
+
+    def _analyze_cli_batch(self, paths: List[Path], policy: str, workers: int = 1) -> List[ConnascenceResult]:
+        """Analyze paths through one pipelined worker batch, else one-shot subprocesses."""
+        # A lone path is not worth starting a worker interpreter for, but
+        # one that is already running is reused
+        running = self._worker is not None and self._worker.alive
+        worker = self._get_worker() if len(paths) > 1 or running else None
+        if worker is not None:
+            try:
+                outputs = worker.request_many(paths, policy)
+                # Error replies are retried per path outside the worker
+                return [
+                    self._result_from_cli_output(output)
+                    if _is_cli_report(output)
+                    else self._analyze_cli_oneshot(path, policy)
+                    for path, output in zip(paths, outputs)
+                ]
+            except Exception as e:
+                # Older CLIs without --serve-stdio exit or answer garbage;
+                # stop trying and use one process per analysis instead.
+                logger.debug(f"Analyzer worker unavailable, using one-shot CLI: {e}")
+                self.close()
+                _WORKER_UNSUPPORTED.add(self._worker_key)
+
+        if len(paths) == 1 or workers <= 1:
+            return [self._analyze_cli_oneshot(path, policy) for path in paths]
+        # Each one-shot run is an independent subprocess that spends its time
+        # in I/O wait, so threads overlap them without contending for the GIL
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=min(workers, len(paths))) as executor:
+            return list(executor.map(lambda path: self._analyze_cli_oneshot(path, policy), paths))
+
+    def _analyze_cli_oneshot(self, path: Path, policy: str) -> ConnascenceResult:
+        """Analyze using a fresh CLI subprocess."""
+        # Only the CLI path needs this; keep it off the import path
+        import subprocess
+
         try:
-            # Build command
-            python_path = self.venv_path / "Scripts" / "python.exe"
-            if not python_path.exists():
-                python_path = "python"
-
-            cmd = [
-                str(python_path),
-                "-m", "connascence",
+            cmd = self._cli_prefix + [
                 "analyze",
                 str(path),
                 "--policy", policy,
@@ -328,64 +1238,73 @@ class ConnascenceBridge:
             result = subprocess.run(
                 cmd,
                 capture_output=True,
-                text=True,
                 timeout=60,
                 cwd=str(self.connascence_path),
             )
 
             if result.returncode == 0:
-                output = json.loads(result.stdout)
-                return ConnascenceResult(
-                    success=True,
-                    sigma_level=output.get("sigma_level", 0.0),
-                    dpmo=output.get("dpmo", 0.0),
-                    nasa_compliance=output.get("nasa_compliance", 0.0),
-                    mece_score=output.get("mece_score", 0.0),
-                    theater_risk=output.get("theater_risk", 0.0),
-                    clarity_score=output.get("clarity_score", 0.0),
-                    violations_count=output.get("total_violations", 0),
-                    critical_violations=output.get("critical_violations", 0),
-                    raw_output=output,
-                )
+                # JSON parsers take the raw bytes; no separate decode pass
+                return self._result_from_cli_output(_loads_json(result.stdout))
             else:
                 # CLI failed, fall back to mock
-                logger.warning(f"CLI failed, using mock: {result.stderr}")
-                return self._analyze_mock(path, policy)
+                stderr = result.stderr.decode(errors="replace")
+                logger.warning(f"CLI failed, using mock: {stderr}")
+                return self._fallback_to_mock(path, policy, f"CLI exited {result.returncode}")
 
         except subprocess.TimeoutExpired:
             return ConnascenceResult(success=False, error="Analysis timeout")
-        except json.JSONDecodeError as e:
+        except ValueError as e:
             # CLI returned non-JSON, fall back to mock
             logger.warning(f"CLI returned non-JSON, using mock: {e}")
-            return self._analyze_mock(path, policy)
+            return self._fallback_to_mock(path, policy, "CLI returned non-JSON")
         except Exception as e:
             logger.error(f"CLI analysis failed: {e}")
-            return self._analyze_mock(path, policy)
+            return self._fallback_to_mock(path, policy, str(e))
+
+    def _fallback_to_mock(self, path: Path, policy: str, reason: str) -> ConnascenceResult:
+        """
+        Mock analysis standing in for a failed CLI run.
 
-    def _analyze_mock(self, path: Path, policy: str) -> ConnascenceResult:
+        Successful results are tagged with a "fallback: " error so callers
+        can tell them apart and the caches never keep them as the CLI's answer.
+        """
+        result = self._analyze_mock(path, policy)
+        if not result.success:
+            return result
+        return replace(result, error=f"{_FALLBACK_PREFIX}{reason}")
+
+    def _analyze_mock(
+        self,
+        path: Path,
+        policy: str,
+        prefetched: Optional[Tuple[bytes, bytes]] = None,
+    ) -> ConnascenceResult:
         """
         Mock analysis when connascence analyzer is not available.
 
         Uses heuristics based on file content to estimate quality.
+        prefetched is the file's (bytes, BLAKE2b digest) when the caller
+        has already read it.
         """
         try:
             path = Path(path)
 
+            if prefetched is not None:
+                return self._estimate_file_bytes(*prefetched, policy)
             if path.is_file():
-                content = path.read_text(errors="ignore")
-                return self._estimate_quality(content, policy)
+                if path.stat().st_size >= _STREAM_MIN_BYTES:
+                    counts = _mmap_estimate_counts(path) or _stream_estimate_counts(path)
+                    return self._result_from_estimates(*counts)
+                data = path.read_bytes()
+                return self._estimate_file_bytes(data, None, policy)
             elif path.is_dir():
                 # Aggregate across files
                 total_lines = 0
                 violation_indicators = 0
 
-                for py_file in path.rglob("*.py"):
-                    try:
-                        content = py_file.read_text(errors="ignore")
-                        total_lines += len(content.split("\n"))
-                        violation_indicators += self._count_violation_indicators(content)
-                    except:
-                        continue
+                for lines, indicators in self._scan_directory(path):
+                    total_lines += lines
+                    violation_indicators += indicators
 
                 # Estimate metrics
                 estimated_dpmo = (violation_indicators / max(total_lines, 1)) * 1_000_000
@@ -408,7 +1327,67 @@ class ConnascenceBridge:
         except Exception as e:
             return ConnascenceResult(success=False, error=str(e))
 
+    def _scan_directory(self, dir_path: Path) -> Iterable[Tuple[int, int]]:
+        """Scan every .py file under dir_path, in parallel for large trees."""
+        files = [entry.path for entry in _iter_python_files(dir_path)]
+        if len(files) >= _PARALLEL_SCAN_MIN_FILES:
+            try:
+                pool = _get_scan_pool()
+                if pool is not None:
+                    # Collected here so pool failures surface inside the try
+                    return list(pool.map(_scan_python_file, files, chunksize=16))
+            except Exception as e:
+                # _scan_python_file never raises, so this is the pool itself
+                logger.debug(f"Scan pool failed, scanning serially: {e}")
+                _discard_scan_pool()
+        return map(_scan_python_file, files)
+
     def _estimate_quality(self, content: str, policy: str) -> ConnascenceResult:
+        """Estimate quality metrics from content, reusing cached estimates."""
+        key = (_content_digest(content), policy)
+        cached = _ESTIMATE_CACHE.get(key)
+        if cached is not None:
+            return cached
+
+        result = self._estimate_quality_uncached(content, policy)
+        _ESTIMATE_CACHE.put(key, result)
+        return result
+
+    def _estimate_file_bytes(
+        self, data: bytes, digest: Optional[bytes], policy: str
+    ) -> ConnascenceResult:
+        """Estimate quality from a small file's bytes (digest: their BLAKE2b, if known)."""
+        if not _NEEDS_DECODE_BYTES_RE.search(data):
+            # ASCII without CRs: bytes are already the text
+            return self._estimate_quality_bytes(data, policy, digest)
+        # Decode exactly as read_text(errors="ignore") would
+        import io
+        content = io.TextIOWrapper(io.BytesIO(data), errors="ignore").read()
+        return self._estimate_quality(content, policy)
+
+    def _estimate_quality_bytes(
+        self, data: bytes, policy: str, digest: Optional[bytes] = None
+    ) -> ConnascenceResult:
+        """
+        Estimate quality metrics from ASCII, CR-free bytes without decoding.
+
+        Shares cache entries with _estimate_quality: the digest of ASCII bytes
+        equals the digest of the same text. Pass digest when the caller has
+        already hashed data.
+        """
+        if digest is None:
+            digest = hashlib.blake2b(data, digest_size=16).digest()
+        key = (digest, policy)
+        cached = _ESTIMATE_CACHE.get(key)
+        if cached is not None:
+            return cached
+
+        np = _get_numpy() if len(data) >= _VECTORIZE_MIN_CHARS else None
+        result = self._result_from_estimates(*_buffer_estimate_counts(data, np))
+        _ESTIMATE_CACHE.put(key, result)
+        return result
+
+    def _estimate_quality_uncached(self, content: str, policy: str) -> ConnascenceResult:
         """Estimate quality metrics from content using heuristics."""
         lines = content.split("\n")
         total_lines = len(lines)
@@ -416,6 +1395,27 @@ class ConnascenceBridge:
         # Count violation indicators
         violations = self._count_violation_indicators(content)
 
+        # Theater risk - check for suspicious patterns
+        theater_indicators = sum(marker in content for marker in _THEATER_MARKERS)
+        theater_indicators += "..." in content and "def " in content
+
+        # NASA compliance - check for critical patterns
+        nasa_violations = sum(marker in content for marker in _NASA_MARKERS)
+        nasa_violations += "goto" in content.lower()
+        nasa_violations += content.count("except:") > 2  # Bare excepts
+
+        return self._result_from_estimates(
+            total_lines, violations, theater_indicators, nasa_violations
+        )
+
+    def _result_from_estimates(
+        self,
+        total_lines: int,
+        violations: int,
+        theater_indicators: int,
+        nasa_violations: int,
+    ) -> ConnascenceResult:
+        """Turn heuristic counts into a ConnascenceResult."""
         # Estimate DPMO
         opportunities = total_lines * 10  # 10 opportunities per line
         dpmo = (violations / max(opportunities, 1)) * 1_000_000
@@ -423,23 +1423,7 @@ class ConnascenceBridge:
         # Convert to sigma level
         sigma_level = self._dpmo_to_sigma(dpmo)
 
-        # Theater risk - check for suspicious patterns
-        theater_indicators = sum([
-            "TODO" in content,
-            "FIXME" in content,
-            "pass  # " in content,
-            "raise NotImplementedError" in content,
-            "..." in content and "def " in content,
-        ])
         theater_risk = min(0.5, theater_indicators * 0.1)
-
-        # NASA compliance - check for critical patterns
-        nasa_violations = sum([
-            "goto" in content.lower(),
-            "eval(" in content,
-            "exec(" in content,
-            content.count("except:") > 2,  # Bare excepts
-        ])
         nasa_compliance = max(0.0, 1.0 - (nasa_violations * 0.1))
 
         return ConnascenceResult(
@@ -456,52 +1440,12 @@ class ConnascenceBridge:
 
     def _count_violation_indicators(self, content: str) -> int:
         """Count potential violation indicators in content."""
-        indicators = 0
-
-        # Long lines (>120 chars)
-        for line in content.split("\n"):
-            if len(line) > 120:
-                indicators += 1
-
-        # Deep nesting
-        max_indent = 0
-        for line in content.split("\n"):
-            indent = len(line) - len(line.lstrip())
-            max_indent = max(max_indent, indent)
-        if max_indent > 20:
-            indicators += max_indent // 4
-
-        # Magic numbers
-        import re
-        magic_numbers = re.findall(r'\b\d{3,}\b', content)
-        indicators += len(magic_numbers)
-
-        # Long functions (estimate)
-        function_count = content.count("def ")
-        if function_count > 0:
-            avg_lines_per_function = len(content.split("\n")) / function_count
-            if avg_lines_per_function > 50:
-                indicators += int(avg_lines_per_function / 50)
-
-        return indicators
+        return _count_violation_indicators(content)
 
     def _dpmo_to_sigma(self, dpmo: float) -> float:
         """Convert DPMO to sigma level (approximate)."""
-        # Approximate conversion table
-        if dpmo <= 3.4:
-            return 6.0
-        elif dpmo <= 233:
-            return 5.0
-        elif dpmo <= 6210:
-            return 4.0
-        elif dpmo <= 66807:
-            return 3.0
-        elif dpmo <= 308538:
-            return 2.0
-        elif dpmo <= 691462:
-            return 1.0
-        else:
-            return 0.0
+        # Approximate conversion table: first threshold >= dpmo wins
+        return _SIGMA_LEVELS[bisect_left(_DPMO_THRESHOLDS, dpmo)]
 
     @property
     def mode(self) -> str:
@@ -513,7 +1457,11 @@ class ConnascenceBridge:
         return self._mode in ("direct", "cli")
 
 
-def analyze_artifact(artifact_path: Path, policy: str = "standard") -> Dict[str, Any]:
+def analyze_artifact(
+    artifact_path: Path,
+    policy: str = "standard",
+    cache_path: Optional[Path] = None,
+) -> Dict[str, Any]:
     """
     Convenience function to analyze an artifact with connascence.
 
@@ -522,34 +1470,78 @@ def analyze_artifact(artifact_path: Path, policy: str = "standard") -> Dict[str,
     Args:
         artifact_path: Path to artifact to analyze
         policy: Analysis policy
+        cache_path: Optional persistent result cache (see ConnascenceBridge)
 
     Returns:
         Dictionary with quality metrics suitable for storage
     """
-    bridge = ConnascenceBridge()
-    result = bridge.analyze_file(artifact_path, policy)
+    return analyze_artifacts([artifact_path], policy, cache_path)[0]
 
-    return {
-        "connascence": result.to_dict(),
-        "analyzer_mode": bridge.mode,
-        "timestamp": datetime.now().isoformat(),
-        "policy": policy,
-    }
+
+def analyze_artifacts(
+    artifact_paths: Iterable[Path],
+    policy: str = "standard",
+    cache_path: Optional[Path] = None,
+    max_workers: int = 4,
+) -> List[Dict[str, Any]]:
+    """
+    Analyze many artifacts with a single bridge.
+
+    Mode detection and analyzer setup happen once for the whole batch
+    instead of once per artifact, and uncached artifacts are analyzed
+    together through ConnascenceBridge.analyze_paths.
+
+    Args:
+        artifact_paths: Paths to artifacts to analyze
+        policy: Analysis policy
+        cache_path: Optional persistent result cache (see ConnascenceBridge)
+        max_workers: Maximum concurrent one-shot CLI analyses
+
+    Returns:
+        List of dictionaries (same shape as analyze_artifact), aligned
+        with the input order
+    """
+    from datetime import datetime
+
+    paths = [Path(p) for p in artifact_paths]
+    if not paths:
+        return []
+
+    bridge = ConnascenceBridge(cache_path=cache_path)
+    try:
+        results = bridge.analyze_paths(paths, policy, workers=max_workers)
+    finally:
+        bridge.close()
+
+    timestamp = datetime.now().isoformat()
+    return [
+        {
+            "connascence": result.to_dict(),
+            "analyzer_mode": bridge.mode,
+            "timestamp": timestamp,
+            "policy": policy,
+        }
+        for result in results
+    ]
 
 
-def quality_gate(path: Path, strict: bool = False) -> bool:
+def quality_gate(path: Path, strict: bool = False, cache_path: Optional[Path] = None) -> bool:
     """
     Quality gate check - returns True if path passes quality standards.
 
     Args:
         path: Path to check
         strict: Use strict thresholds
+        cache_path: Optional persistent result cache (see ConnascenceBridge)
 
     Returns:
         True if passes, False otherwise
     """
-    bridge = ConnascenceBridge()
-    result = bridge.analyze_directory(path) if path.is_dir() else bridge.analyze_file(path)
+    bridge = ConnascenceBridge(cache_path=cache_path)
+    try:
+        result = bridge.analyze_directory(path) if path.is_dir() else bridge.analyze_file(path)
+    finally:
+        bridge.close()
     return result.passes_gate(strict=strict)
 
 
@@ -0,0 +1,38 @@
+"""
+JSON serialization shared by loop state, migration and verification reports.
+
+orjson is used when installed (perf extra); output is byte-compatible with
+the stdlib json module either way.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+
+def dumps_json(obj: Any, indent: bool = True) -> bytes:
+    """
+    Serialize obj as JSON bytes, using orjson when available.
+
+    Readers decode these files with the locale encoding, so orjson output
+    is only used when it is pure ASCII (as json.dumps output always is).
+    Objects orjson cannot encode fall back to the stdlib.
+
+    Args:
+        obj: Object to serialize
+        indent: Indent by 2 spaces; otherwise compact (no whitespace)
+    """
+    if _orjson is not None:
+        try:
+            data = _orjson.dumps(obj, option=_orjson.OPT_INDENT_2 if indent else None)
+            if data.isascii():
+                return data
+        except TypeError:
+            pass
+    if indent:
+        return json.dumps(obj, indent=2).encode()
+    return json.dumps(obj, separators=(",", ":")).encode()
@@ -176,6 +176,8 @@ class UnifiedBridge:
         self.policy_path = self.loop_dir / "policy.json"
         self.history_path = self.loop_dir / "history.json"
         self.moo_state_path = self.loop_dir / "moo_state.json"
+        # Parsed policy.json with the (mtime_ns, size) it was read at
+        self._policy_cache: Optional[Tuple[Tuple[int, int], Dict[str, Any]]] = None
 
         # Load mode library for selection
         self.mode_library = ModeLibrary()
@@ -192,10 +194,23 @@ class UnifiedBridge:
         return self._default_config()
 
     def load_policy(self) -> Dict[str, Any]:
-        """Load governance policy."""
-        if self.policy_path.exists():
-            return json.loads(self.policy_path.read_text())
-        return {"regression_threshold": 0.03, "max_iterations": 50}
+        """
+        Load governance policy.
+
+        The policy is only edited by humans, so the parsed file is reused
+        until its mtime or size changes. Callers must not mutate it.
+        """
+        try:
+            st = os.stat(self.policy_path)
+        except (FileNotFoundError, NotADirectoryError):
+            return {"regression_threshold": 0.03, "max_iterations": 50}
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = self._policy_cache
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        policy = json.loads(self.policy_path.read_text())
+        self._policy_cache = (stamp, policy)
+        return policy
 
     def load_eval_report(self) -> Dict[str, Any]:
         """Load evaluation report (harness output only)."""
@@ -133,8 +133,7 @@ Examples:
         print(f"Evaluation Mode: {harness.evaluation_mode}")
         print(f"CLI Evaluator: {'AVAILABLE' if harness._cli_evaluator else 'NOT AVAILABLE'}")
 
-        # Create test artifact
-        import tempfile
+        # Test artifact (graded in memory, no temp file)
         test_content = """
 [assert|confident] This is a test artifact for FrozenHarness evaluation.
 [ground:self-test] The content demonstrates VERIX compliance.
@@ -150,15 +149,11 @@ def safe_divide(a, b):
 
 [conf:0.85] [state:confirmed] Test complete.
 """
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-            f.write(test_content)
-            test_path = Path(f.name)
-
-        print(f"\nTest Artifact: {test_path}")
+        print(f"\nTest Artifact: <in-memory, {len(test_content)} chars>")
         print("\nGrading...")
 
         # Grade the test artifact
-        metrics = harness.grade(test_path)
+        metrics = harness.grade_content(test_content)
 
         print("\n--- Results ---")
         for key, value in metrics.items():
@@ -167,9 +162,6 @@ def safe_divide(a, b):
             else:
                 print(f"  {key}: {value}")
 
-        # Cleanup
-        test_path.unlink()
-
         # Verify thresholds
         print("\n--- Verification ---")
         passed = True
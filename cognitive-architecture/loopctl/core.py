@@ -14,14 +14,17 @@ INVARIANTS:
 - Events are append-only
 """
 
+import io
 import os
 import sys
 import json
+import time
 import hashlib
+import functools
 import subprocess
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, FrozenSet, Optional, Tuple
 
 
 # =============================================================================
@@ -33,26 +36,57 @@ from typing import Dict, Any, Optional, Tuple
 # 3. Setting environment variable META_LOOP_EMERGENCY_STOP=true
 # =============================================================================
 
+# This module's location never changes, so derive its paths once
+_MODULE_FILE = Path(__file__)
+_MODULE_PATH = str(_MODULE_FILE)
+_PLUGIN_ROOT = _MODULE_FILE.parent.parent.parent
+
+# Kill switch files outside the current directory never move, so build them once
+_HOME_STOP_FILE = Path(os.path.expanduser('~/.meta-loop-stop'))
+_PLUGIN_STOP_FILE = _PLUGIN_ROOT / '.meta-loop-stop'
+
+# Kill switch file probes are reused for this many seconds (per working
+# directory), so hot loops do not stat three files on every iteration
+_EMERGENCY_TTL = 1.0
+_emergency_cache: Dict[str, Tuple[float, Tuple[bool, str]]] = {}
+
+
+def _check_stop_files() -> Tuple[bool, str]:
+    """Probe the kill switch files, reusing a result younger than _EMERGENCY_TTL."""
+    cwd = os.getcwd()
+    now = time.monotonic()
+    cached = _emergency_cache.get(cwd)
+    if cached is not None and now - cached[0] < _EMERGENCY_TTL:
+        return cached[1]
+
+    result = (False, "")
+    # File-based kill switch - current directory
+    if Path('.meta-loop-stop').exists():
+        result = (True, "EMERGENCY_HALT: Kill switch file found in current directory")
+    # File-based kill switch - home directory
+    elif _HOME_STOP_FILE.exists():
+        result = (True, f"EMERGENCY_HALT: Kill switch file found at {_HOME_STOP_FILE}")
+    # File-based kill switch - plugin directory
+    elif _PLUGIN_STOP_FILE.exists():
+        result = (True, f"EMERGENCY_HALT: Kill switch file found at {_PLUGIN_STOP_FILE}")
+
+    _emergency_cache[cwd] = (now, result)
+    return result
+
+
 def check_emergency_stop() -> tuple:
     """
     Check for emergency stop signals.
 
+    Kill switch file probes are cached for _EMERGENCY_TTL seconds; the
+    environment variable is checked on every call.
+
     Returns:
         tuple: (should_stop: bool, reason: str)
     """
-    # File-based kill switch - current directory
-    if Path('.meta-loop-stop').exists():
-        return True, "EMERGENCY_HALT: Kill switch file found in current directory"
-
-    # File-based kill switch - home directory
-    home_stop = Path(os.path.expanduser('~/.meta-loop-stop'))
-    if home_stop.exists():
-        return True, f"EMERGENCY_HALT: Kill switch file found at {home_stop}"
-
-    # File-based kill switch - plugin directory
-    plugin_stop = Path(__file__).parent.parent.parent / '.meta-loop-stop'
-    if plugin_stop.exists():
-        return True, f"EMERGENCY_HALT: Kill switch file found at {plugin_stop}"
+    should_stop, reason = _check_stop_files()
+    if should_stop:
+        return should_stop, reason
 
     # Environment variable kill switch
     env_stop = os.environ.get('META_LOOP_EMERGENCY_STOP', '').lower()
@@ -61,8 +95,10 @@ def check_emergency_stop() -> tuple:
 
     return False, ""
 
-# Add parent paths for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Add parent paths for imports (once, however often this module is reloaded)
+_PACKAGE_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(_MODULE_PATH)))
+if _PACKAGE_ROOT not in sys.path:
+    sys.path.insert(0, _PACKAGE_ROOT)
 
 from integration.unified_bridge import (
     UnifiedBridge,
@@ -74,6 +110,127 @@ from integration.unified_bridge import (
 )
 from integration.telemetry_bridge import TelemetryBridge
 from integration.connascence_bridge import ConnascenceBridge, ConnascenceResult
+from integration.json_io import dumps_json as _dumps_json
+
+# Prefer orjson for loop state files when installed (perf extra)
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+
+def _loads_json(data):
+    """Parse JSON text or bytes, using orjson when available."""
+    if _orjson is not None:
+        return _orjson.loads(data)
+    return json.loads(data)
+
+
+def _write_json_atomic(path: Path, obj: Any, indent: bool = True) -> None:
+    """Write obj as JSON via a temp file + os.replace, so readers never see a partial file."""
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_bytes(_dumps_json(obj, indent=indent))
+    os.replace(tmp_path, path)
+
+
+def _debug_json_enabled() -> bool:
+    """Whether META_LOOP_DEBUG_JSON asks for human-readable report copies."""
+    return os.environ.get('META_LOOP_DEBUG_JSON', '').lower() in ('true', '1', 'yes')
+
+
+# CLI evaluator is optional (sibling evals package on the path added above)
+try:
+    from evals.cli_evaluator import ClaudeCLI
+except ImportError:
+    ClaudeCLI = None
+
+
+@functools.lru_cache(maxsize=1)
+def _available_cli_evaluator():
+    """
+    Return a ClaudeCLI if the claude CLI is installed, else None.
+
+    The availability probe spawns `claude --version`, so it runs once per
+    process rather than once per FrozenHarness.
+    """
+    if ClaudeCLI is None:
+        return None
+    try:
+        cli = ClaudeCLI()
+        return cli if cli.is_available else None
+    except Exception:
+        return None
+
+
+# Heuristic grading markers, matched against lowercased content
+_COMPLETION_MARKERS = ("[assert", "[witnessed")
+_ROBUSTNESS_MARKERS = ("error", "exception", "edge case", "boundary", "validation")
+_VERIX_MARKERS = ("[assert", "[conf:", "[ground:", "[state:", "[witnessed", "[inferred")
+# Every distinct marker, so shared ones ("[assert", "[witnessed") are probed once
+_ALL_MARKERS = tuple(dict.fromkeys(_COMPLETION_MARKERS + _ROBUSTNESS_MARKERS + _VERIX_MARKERS))
+
+
+def _find_markers(content_lower: str) -> FrozenSet[str]:
+    """Return the grading markers present in lowercased content."""
+    return frozenset(marker for marker in _ALL_MARKERS if marker in content_lower)
+
+
+# LLM-as-judge prompt, wrapped around at most _JUDGE_CONTENT_LIMIT characters
+_JUDGE_CONTENT_LIMIT = 3000
+_JUDGE_PROMPT_HEADER = """You are evaluating code/text quality. Score each dimension from 0.0 to 1.0.
+
+CONTENT TO EVALUATE:
+"""
+_JUDGE_PROMPT_FOOTER = """
+
+Score these dimensions (0.0 to 1.0):
+1. task_accuracy: Does the content accomplish the stated task correctly?
+2. token_efficiency: Is the content concise without unnecessary verbosity?
+3. edge_robustness: Does it handle edge cases and errors appropriately?
+4. epistemic_consistency: Are claims properly qualified with confidence/evidence?
+
+Respond in JSON format ONLY:
+{"task_accuracy": 0.0, "token_efficiency": 0.0, "edge_robustness": 0.0, "epistemic_consistency": 0.0}"""
+
+
+# What each heuristic grader returns for empty content (no words, no markers)
+_EMPTY_CONTENT_SCORES = {
+    "task_accuracy": 0.0,
+    "token_efficiency": 0.9,
+    "edge_robustness": 0.5,
+    "epistemic_consistency": 0.4,
+}
+
+
+@functools.lru_cache(maxsize=4)
+def _harness_file_hash(path: str, mtime_ns: int, version: str) -> str:
+    """
+    Hash the harness source once per (file, mtime, version).
+
+    FrozenHarness is built on every loop iteration; the mtime in the key
+    means an edited harness is re-hashed, and so still fails integrity.
+    """
+    file_hash = _sha256_file(Path(path))[:12]
+    return f"frozen_eval_harness_v{version}_{file_hash}"
+
+
+def _harness_mtime_ns() -> Optional[int]:
+    """mtime of the harness source, or None when it cannot be stat'ed."""
+    try:
+        return os.stat(_MODULE_PATH).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _sha256_file(path: Path, chunk_size: int = 1 << 20) -> str:
+    """SHA-256 hex digest of a file, streamed instead of read whole."""
+    with open(path, "rb") as f:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+: C read loop
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        digest = hashlib.sha256()
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+        return digest.hexdigest()
 
 
 class FrozenHarness:
@@ -100,37 +257,30 @@ class FrozenHarness:
         self.use_cli_evaluator = use_cli_evaluator
         self.use_connascence = use_connascence
         self._harness_hash = self._compute_hash()
-        self._cli_evaluator = None
-        self._connascence_bridge = None
+        # The CLI evaluator and Connascence bridge are created on first use
+        # (see the cached properties below), so iterations that never grade
+        # an existing artifact do not pay for them.
 
-        # Try to initialize CLI evaluator
-        if use_cli_evaluator:
-            self._cli_evaluator = self._init_cli_evaluator()
+    @functools.cached_property
+    def _cli_evaluator(self):
+        """CLI evaluator, or None when disabled or unavailable."""
+        return self._init_cli_evaluator() if self.use_cli_evaluator else None
 
-        # Try to initialize Connascence bridge
-        if use_connascence:
-            self._connascence_bridge = self._init_connascence_bridge()
+    @functools.cached_property
+    def _connascence_bridge(self):
+        """Connascence bridge, or None when disabled or unavailable."""
+        return self._init_connascence_bridge() if self.use_connascence else None
 
     def _init_cli_evaluator(self):
-        """Initialize CLI evaluator if available."""
-        try:
-            # Import from sibling evals module
-            eval_path = Path(__file__).parent.parent / "evals"
-            if eval_path.exists():
-                import sys
-                sys.path.insert(0, str(eval_path.parent))
-                from evals.cli_evaluator import ClaudeCLI
-                cli = ClaudeCLI()
-                if cli.is_available:
-                    return cli
-        except Exception as e:
-            pass  # Silently fall back to heuristics
-        return None
+        """Initialize CLI evaluator if available (silently falls back to heuristics)."""
+        return _available_cli_evaluator()
 
     def _init_connascence_bridge(self):
         """Initialize Connascence bridge for quality metrics."""
         try:
-            bridge = ConnascenceBridge()
+            # Persist results so unchanged artifacts are not re-analyzed
+            # on later loop iterations
+            bridge = ConnascenceBridge(cache_path=self.loop_dir / "cache" / "connascence.json")
             return bridge
         except Exception as e:
             pass  # Connascence analysis is optional
@@ -138,14 +288,18 @@ class FrozenHarness:
 
     def _compute_hash(self) -> str:
         """Compute hash of harness for integrity verification."""
+        return self._hash_for_mtime(_harness_mtime_ns())
+
+    def _hash_for_mtime(self, mtime_ns: Optional[int]) -> str:
+        """Harness hash for the given source mtime (None: source unreadable)."""
         # Hash actual harness code for integrity
-        import hashlib
-        harness_file = Path(__file__)
-        if harness_file.exists():
-            content = harness_file.read_bytes()
-            file_hash = hashlib.sha256(content).hexdigest()[:12]
-            return f"frozen_eval_harness_v{self.harness_version}_{file_hash}"
-        return f"frozen_eval_harness_v{self.harness_version}"
+        if mtime_ns is None:
+            return f"frozen_eval_harness_v{self.harness_version}"
+        return _harness_file_hash(_MODULE_PATH, mtime_ns, self.harness_version)
+
+    def refresh_hash(self, mtime_ns: Optional[int]) -> None:
+        """Re-derive the integrity hash after the harness source changed."""
+        self._harness_hash = self._hash_for_mtime(mtime_ns)
 
     @property
     def current_hash(self) -> str:
@@ -169,7 +323,7 @@ class FrozenHarness:
             return True
         return self._harness_hash == expected_hash
 
-    def grade(self, artifact_path: Path) -> Dict[str, Any]:
+    def grade(self, artifact_path: Path, content_bytes: Optional[bytes] = None) -> Dict[str, Any]:
         """
         Grade an artifact and return metrics.
 
@@ -177,11 +331,16 @@ class FrozenHarness:
         falls back to heuristics otherwise.
         Optionally includes connascence quality metrics.
 
+        Args:
+            artifact_path: Artifact to grade
+            content_bytes: The artifact's bytes, if the caller already read
+                them; the file is then not read again
+
         Returns metrics dict (NOT model-reported).
         """
         artifact_path = Path(artifact_path)
 
-        if not artifact_path.exists():
+        if content_bytes is None and not artifact_path.exists():
             return {
                 "task_accuracy": 0.0,
                 "token_efficiency": 0.0,
@@ -193,21 +352,11 @@ class FrozenHarness:
             }
 
         # Read artifact content
-        content = artifact_path.read_text(errors="ignore")
-
-        # Try CLI evaluator first (real LLM-based)
-        if self._cli_evaluator:
-            try:
-                metrics = self._grade_with_cli(content)
-                metrics["evaluation_mode"] = "cli_evaluator"
-            except Exception as e:
-                # Log but continue to fallback
-                metrics = self._grade_with_heuristics(content)
-                metrics["evaluation_mode"] = "heuristic"
+        if content_bytes is None:
+            content = artifact_path.read_text(errors="ignore")
         else:
-            # Fallback: heuristic grading
-            metrics = self._grade_with_heuristics(content)
-            metrics["evaluation_mode"] = "heuristic"
+            content = _decode_text(content_bytes)
+        metrics = self._grade_text(content)
 
         # Add connascence quality metrics if enabled
         if self._connascence_bridge:
@@ -233,6 +382,34 @@ class FrozenHarness:
 
         return metrics
 
+    def grade_content(self, content: str) -> Dict[str, Any]:
+        """
+        Grade in-memory artifact content without touching the filesystem.
+
+        Same metrics as grade(), except connascence analysis, which needs
+        a file on disk, is reported as disabled.
+        """
+        metrics = self._grade_text(content)
+        metrics["connascence_mode"] = "disabled"
+        return metrics
+
+    def _grade_text(self, content: str) -> Dict[str, Any]:
+        """Grade content with the CLI evaluator, falling back to heuristics."""
+        # Try CLI evaluator first (real LLM-based)
+        if self._cli_evaluator:
+            try:
+                metrics = self._grade_with_cli(content)
+                metrics["evaluation_mode"] = "cli_evaluator"
+            except Exception as e:
+                # Log but continue to fallback
+                metrics = self._grade_with_heuristics(content)
+                metrics["evaluation_mode"] = "heuristic"
+        else:
+            # Fallback: heuristic grading
+            metrics = self._grade_with_heuristics(content)
+            metrics["evaluation_mode"] = "heuristic"
+        return metrics
+
     def _grade_with_connascence(self, artifact_path: Path) -> ConnascenceResult:
         """
         Grade using Connascence Analyzer (7-Analyzer Suite).
@@ -254,38 +431,25 @@ class FrozenHarness:
 
         Sends content to Claude CLI for evaluation.
         """
-        judge_prompt = f"""You are evaluating code/text quality. Score each dimension from 0.0 to 1.0.
-
-CONTENT TO EVALUATE:
-{content[:3000]}
-
-Score these dimensions (0.0 to 1.0):
-1. task_accuracy: Does the content accomplish the stated task correctly?
-2. token_efficiency: Is the content concise without unnecessary verbosity?
-3. edge_robustness: Does it handle edge cases and errors appropriately?
-4. epistemic_consistency: Are claims properly qualified with confidence/evidence?
-
-Respond in JSON format ONLY:
-{{"task_accuracy": 0.0, "token_efficiency": 0.0, "edge_robustness": 0.0, "epistemic_consistency": 0.0}}"""
+        if len(content) > _JUDGE_CONTENT_LIMIT:
+            content = content[:_JUDGE_CONTENT_LIMIT]
+        judge_prompt = "".join((_JUDGE_PROMPT_HEADER, content, _JUDGE_PROMPT_FOOTER))
 
         result = self._cli_evaluator.send_message(judge_prompt, max_tokens=200)
         response = result.get("response", "")
 
         # Parse JSON from response
-        import json
         start = response.find('{')
         end = response.rfind('}') + 1
         if start >= 0 and end > start:
-            scores = json.loads(response[start:end])
-            # Calculate overall
-            weights = {
-                "task_accuracy": 0.4,
-                "token_efficiency": 0.2,
-                "edge_robustness": 0.2,
-                "epistemic_consistency": 0.2,
-            }
-            scores["overall"] = sum(
-                scores.get(k, 0.5) * w for k, w in weights.items()
+            scores = _loads_json(response[start:end])
+            # Calculate overall (weights 0.4/0.2/0.2/0.2; missing scores count as 0.5)
+            get = scores.get
+            scores["overall"] = (
+                get("task_accuracy", 0.5) * 0.4
+                + get("token_efficiency", 0.5) * 0.2
+                + get("edge_robustness", 0.5) * 0.2
+                + get("epistemic_consistency", 0.5) * 0.2
             )
             return scores
 
@@ -293,41 +457,48 @@ Respond in JSON format ONLY:
 
     def _grade_with_heuristics(self, content: str) -> Dict[str, float]:
         """Grade using heuristic rules (fallback)."""
-        metrics = {
-            "task_accuracy": self._grade_accuracy(content),
-            "token_efficiency": self._grade_efficiency(content),
-            "edge_robustness": self._grade_robustness(content),
-            "epistemic_consistency": self._grade_epistemic(content),
-        }
+        if not content:
+            # Nothing to scan; an empty artifact's scores are fixed
+            metrics = dict(_EMPTY_CONTENT_SCORES)
+        else:
+            # Lowercase and scan for markers once, shared by the marker graders
+            markers = _find_markers(content.lower())
+            metrics = {
+                "task_accuracy": self._grade_accuracy(content, markers),
+                "token_efficiency": self._grade_efficiency(content),
+                "edge_robustness": self._grade_robustness(content, markers),
+                "epistemic_consistency": self._grade_epistemic(content, markers),
+            }
 
-        # Overall is weighted average
-        weights = {
-            "task_accuracy": 0.4,
-            "token_efficiency": 0.2,
-            "edge_robustness": 0.2,
-            "epistemic_consistency": 0.2,
-        }
-        metrics["overall"] = sum(
-            metrics[k] * weights[k] for k in weights
+        # Overall is weighted average (weights 0.4/0.2/0.2/0.2)
+        metrics["overall"] = (
+            metrics["task_accuracy"] * 0.4
+            + metrics["token_efficiency"] * 0.2
+            + metrics["edge_robustness"] * 0.2
+            + metrics["epistemic_consistency"] * 0.2
         )
 
         return metrics
 
-    def _grade_accuracy(self, content: str) -> float:
+    def _grade_accuracy(self, content: str, markers: Optional[FrozenSet[str]] = None) -> float:
         """Grade task accuracy (simplified)."""
         # Check for completion indicators
         if not content:
             return 0.0
         if len(content) < 100:
             return 0.3
-        if "[assert" in content.lower() or "[witnessed" in content.lower():
+        if markers is None:
+            markers = _find_markers(content.lower())
+        if any(marker in markers for marker in _COMPLETION_MARKERS):
             return 0.8
         return 0.6
 
     def _grade_efficiency(self, content: str) -> float:
         """Grade token efficiency (simplified)."""
-        # Shorter responses with same quality = more efficient
-        word_count = len(content.split())
+        # Shorter responses with same quality = more efficient. Only the
+        # bucket matters, so stop splitting once the last threshold is
+        # passed (any count >= 500 scores the same).
+        word_count = len(content.split(maxsplit=500))
         if word_count < 50:
             return 0.9
         elif word_count < 200:
@@ -337,43 +508,176 @@ Respond in JSON format ONLY:
         else:
             return 0.5
 
-    def _grade_robustness(self, content: str) -> float:
+    def _grade_robustness(self, content: str, markers: Optional[FrozenSet[str]] = None) -> float:
         """Grade edge case handling (simplified)."""
         # Check for error handling indicators
-        indicators = ["error", "exception", "edge case", "boundary", "validation"]
-        count = sum(1 for i in indicators if i in content.lower())
+        if markers is None:
+            markers = _find_markers(content.lower())
+        count = sum(1 for i in _ROBUSTNESS_MARKERS if i in markers)
         return min(0.9, 0.5 + count * 0.1)
 
-    def _grade_epistemic(self, content: str) -> float:
+    def _grade_epistemic(self, content: str, markers: Optional[FrozenSet[str]] = None) -> float:
         """Grade epistemic consistency (simplified)."""
         # Check for VERIX markers
-        verix_markers = ["[assert", "[conf:", "[ground:", "[state:", "[witnessed", "[inferred"]
-        count = sum(1 for m in verix_markers if m in content.lower())
+        if markers is None:
+            markers = _find_markers(content.lower())
+        count = sum(1 for m in _VERIX_MARKERS if m in markers)
         return min(0.95, 0.4 + count * 0.1)
 
 
+def _decode_text(raw: bytes) -> str:
+    """Decode bytes exactly as Path.read_text(errors="ignore") would."""
+    return io.TextIOWrapper(io.BytesIO(raw), errors="ignore").read()
+
+
+# Harnesses and bridges are stateless between iterations (all loop state
+# lives in files under loop_dir), so one of each is kept per loop directory
+# instead of re-initializing evaluators and mode libraries every iteration.
+# Both are built from the resolved path, so a later chdir cannot move
+# where a cached object reads and writes.
+# Harnesses are stored with the source mtime they were hashed at, so an
+# edit made while the process runs still changes the integrity hash.
+_HARNESS_CACHE: Dict[Path, Tuple[Optional[int], FrozenHarness]] = {}
+_BRIDGE_CACHE: Dict[Path, UnifiedBridge] = {}
+
+
+def _get_harness(loop_dir: Path) -> FrozenHarness:
+    """Return the cached FrozenHarness for loop_dir, creating it on first use."""
+    key = loop_dir.resolve()
+    mtime_ns = _harness_mtime_ns()
+    entry = _HARNESS_CACHE.get(key)
+    if entry is None:
+        entry = _HARNESS_CACHE.setdefault(key, (mtime_ns, FrozenHarness(key)))
+    stamp, harness = entry
+    if stamp != mtime_ns:
+        harness.refresh_hash(mtime_ns)
+        _HARNESS_CACHE[key] = (mtime_ns, harness)
+    return harness
+
+
+def _get_bridge(loop_dir: Path) -> UnifiedBridge:
+    """Return the cached UnifiedBridge for loop_dir, creating it on first use."""
+    key = loop_dir.resolve()
+    bridge = _BRIDGE_CACHE.get(key)
+    if bridge is None:
+        bridge = _BRIDGE_CACHE.setdefault(key, UnifiedBridge(key))
+    return bridge
+
+
+# Artifact found per (loop_dir, working directory), reused for this many
+# seconds so repeated lookups skip the probes below it. Candidates that
+# outrank a cached hit are still probed, so a newly written
+# higher-priority artifact wins at once.
+_ARTIFACT_TTL = 1.0
+_artifact_cache: Dict[Tuple[str, str], Tuple[float, int]] = {}
+
+
 def find_artifact(output_path: Optional[str], loop_dir: Path) -> Path:
     """Find the artifact to grade."""
     if output_path:
         return Path(output_path)
 
     # Look for common output patterns
-    candidates = [
+    candidates = (
         loop_dir / "output" / "latest.txt",
         loop_dir / "output.txt",
         Path(".claude") / "output.txt",
-    ]
+    )
 
-    for candidate in candidates:
-        if candidate.exists():
-            return candidate
+    key = (str(loop_dir), os.getcwd())
+    now = time.monotonic()
+    cached = _artifact_cache.get(key)
+    probe_until = len(candidates)
+    if cached is not None and now - cached[0] < _ARTIFACT_TTL:
+        probe_until = cached[1]
 
-    # Return a non-existent path (harness will handle)
-    return loop_dir / "output" / "latest.txt"
+    for index, candidate in enumerate(candidates[:probe_until]):
+        try:
+            os.stat(candidate)
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+        _artifact_cache[key] = (now, index)
+        return candidate
+
+    if probe_until < len(candidates):
+        # Nothing outranks the cached hit
+        return candidates[probe_until]
+
+    # Return a non-existent path (harness will handle); not cached, so a
+    # newly written artifact is picked up on the next call
+    return candidates[0]
+
+
+# .git directory per working directory (None when not in a repository)
+_git_dir_cache: Dict[str, Optional[Path]] = {}
+
+
+def _find_git_dir() -> Optional[Path]:
+    """Locate the .git directory for the current working directory."""
+    cwd = os.getcwd()
+    if cwd in _git_dir_cache:
+        return _git_dir_cache[cwd]
+
+    git_dir = None
+    start = Path(cwd)
+    for directory in (start, *start.parents):
+        dot_git = directory / ".git"
+        if dot_git.is_dir():
+            git_dir = dot_git
+            break
+        if dot_git.is_file():
+            # Worktrees and submodules: ".git" file pointing at the real dir
+            content = dot_git.read_text().strip()
+            if content.startswith("gitdir:"):
+                git_dir = (directory / content[len("gitdir:"):].strip()).resolve()
+            break
+    _git_dir_cache[cwd] = git_dir
+    return git_dir
+
+
+def _read_git_head(git_dir: Path) -> Optional[str]:
+    """Resolve HEAD to a commit hash by reading the repository files."""
+    head = (git_dir / "HEAD").read_text().strip()
+    if not head.startswith("ref:"):
+        return head  # Detached HEAD
+
+    ref = head[len("ref:"):].strip()
+    # Linked worktrees keep shared refs in the common directory
+    search_dirs = [git_dir]
+    commondir = git_dir / "commondir"
+    if commondir.is_file():
+        search_dirs.append((git_dir / commondir.read_text().strip()).resolve())
+
+    for directory in search_dirs:
+        ref_file = directory / ref
+        if ref_file.is_file():
+            return ref_file.read_text().strip()
+        packed = directory / "packed-refs"
+        if packed.is_file():
+            for line in packed.read_text().splitlines():
+                if line.endswith(" " + ref) and not line.startswith(("#", "^")):
+                    return line.split(" ", 1)[0]
+    return None
 
 
 def get_git_head() -> Optional[str]:
-    """Get current git HEAD hash."""
+    """
+    Get current git HEAD hash (short form).
+
+    Reads .git/HEAD and the ref it points to directly instead of forking
+    git on every iteration; falls back to `git rev-parse` for layouts it
+    cannot resolve.
+    """
+    try:
+        git_dir = _find_git_dir()
+        if git_dir is None:
+            return None
+        commit = _read_git_head(git_dir)
+        if commit:
+            return commit[:7]
+    except OSError:
+        pass
+
     try:
         result = subprocess.run(
             ["git", "rev-parse", "--short", "HEAD"],
@@ -426,7 +730,7 @@ def ralph_iteration_complete(
         }
 
     loop_dir = Path(loop_dir)
-    bridge = UnifiedBridge(loop_dir)
+    bridge = _get_bridge(loop_dir)
 
     # 1. Load current state
     current_config = bridge.load_runtime_config()
@@ -441,7 +745,7 @@ def ralph_iteration_complete(
     artifact_path = find_artifact(output_path, loop_dir)
 
     # 3. Grade with FROZEN harness (authoritative)
-    harness = FrozenHarness(loop_dir)
+    harness = _get_harness(loop_dir)
     expected_hash = policy.get("harness_hash")
 
     if not harness.verify_integrity(expected_hash):
@@ -450,29 +754,39 @@ def ralph_iteration_complete(
             "reason": "HALT: Harness integrity check failed",
         }
 
-    harness_metrics = harness.grade(artifact_path)
+    # Read the artifact once for both grading and the report hash
+    try:
+        artifact_bytes = artifact_path.read_bytes()
+    except OSError:
+        artifact_bytes = None
+
+    harness_metrics = harness.grade(artifact_path, content_bytes=artifact_bytes)
+    # One clock reading stamps both the eval report and the event
+    graded_at = datetime.now().isoformat()
 
     # 4. Write authoritative eval report
     eval_report = {
         "_comment": "EVIDENCE TRUTH - Written ONLY by Frozen Eval Harness",
         "_schema_version": "1.0.0",
         "iteration": iteration,
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": graded_at,
         "artifact_path": str(artifact_path),
-        "artifact_hash": hashlib.sha256(
-            artifact_path.read_bytes() if artifact_path.exists() else b""
-        ).hexdigest()[:16],
+        "artifact_hash": hashlib.sha256(artifact_bytes or b"").hexdigest()[:16],
         "metrics": harness_metrics,
         "harness_version": harness.harness_version,
         "harness_hash": harness.current_hash,
     }
-    (loop_dir / "eval_report.json").write_text(json.dumps(eval_report, indent=2))
+    # Machine-read on every iteration: compact, and replaced atomically so
+    # concurrent readers never see a torn file
+    _write_json_atomic(loop_dir / "eval_report.json", eval_report, indent=False)
+    if _debug_json_enabled():
+        _write_json_atomic(loop_dir / "eval_report.pretty.json", eval_report)
 
     # 5. Build bridge input
-    task_metadata = {}
-    task_meta_path = loop_dir / "task_metadata.json"
-    if task_meta_path.exists():
-        task_metadata = json.loads(task_meta_path.read_text())
+    try:
+        task_metadata = _loads_json((loop_dir / "task_metadata.json").read_bytes())
+    except FileNotFoundError:
+        task_metadata = {}
 
     bridge_input = BridgeInput(
         iteration=iteration,
@@ -489,6 +803,7 @@ def ralph_iteration_complete(
 
     # 7. Build event
     event = UnifiedEvent(
+        timestamp=graded_at,
         task_id=f"ralph_{iteration}",
         plane=Plane.EXECUTION.value,
         timescale=Timescale.MICRO.value,
@@ -548,7 +863,7 @@ def ralph_iteration_complete(
 def get_status(loop_dir: str) -> Dict[str, Any]:
     """Get current loop status."""
     loop_dir = Path(loop_dir)
-    bridge = UnifiedBridge(loop_dir)
+    bridge = _get_bridge(loop_dir)
 
     config = bridge.load_runtime_config()
     eval_report = bridge.load_eval_report()
@@ -569,21 +884,27 @@ def get_status(loop_dir: str) -> Dict[str, Any]:
 def reset_loop(loop_dir: str) -> Dict[str, Any]:
     """Reset loop state to defaults."""
     loop_dir = Path(loop_dir)
-    bridge = UnifiedBridge(loop_dir)
+    bridge = _get_bridge(loop_dir)
 
-    # Write default config
+    # Serialize both files, then write them concurrently so their I/O
+    # latencies overlap (matters on network filesystems)
     default_config = bridge._default_config()
-    (loop_dir / "runtime_config.json").write_text(json.dumps({
-        "_comment": "CONTROL INPUT - Reset by loopctl",
-        "_schema_version": "1.0.0",
-        **default_config,
-        "updated_at": datetime.now().isoformat(),
-    }, indent=2))
-
-    # Reset history
-    (loop_dir / "history.json").write_text(json.dumps({
-        "_comment": "ITERATION HISTORY - Reset by loopctl",
-        "iterations": [],
-    }, indent=2))
+    writes = (
+        (loop_dir / "runtime_config.json", _dumps_json({
+            "_comment": "CONTROL INPUT - Reset by loopctl",
+            "_schema_version": "1.0.0",
+            **default_config,
+            "updated_at": datetime.now().isoformat(),
+        })),
+        (loop_dir / "history.json", _dumps_json({
+            "_comment": "ITERATION HISTORY - Reset by loopctl",
+            "iterations": [],
+        })),
+    )
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=len(writes)) as executor:
+        futures = [executor.submit(path.write_bytes, data) for path, data in writes]
+        for future in futures:
+            future.result()
 
     return {"status": "reset", "message": "Loop state reset to defaults"}
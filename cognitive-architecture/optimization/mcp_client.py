@@ -18,7 +18,7 @@ import sys
 import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 import logging
 
 logger = logging.getLogger(__name__)
@@ -296,6 +296,45 @@ class MemoryMCPClient:
                 tool_name="memory_store",
             )
 
+    def memory_store_batch(
+        self,
+        entries: List[Tuple[str, Union[str, Dict], Optional[Dict[str, str]]]],
+        max_workers: int = 8,
+    ) -> List[MCPToolResult]:
+        """
+        Store several values, overlapping their round-trips.
+
+        Entries sharing a key are stored in order by a single worker, so
+        the last one wins exactly as with sequential memory_store calls.
+
+        Args:
+            entries: (key, value, metadata) tuples as for memory_store
+            max_workers: Maximum concurrent stores
+
+        Returns:
+            One MCPToolResult per entry, in entry order
+        """
+        results: List[Optional[MCPToolResult]] = [None] * len(entries)
+        groups: Dict[str, List[int]] = {}
+        for index, (key, _, _) in enumerate(entries):
+            groups.setdefault(key, []).append(index)
+
+        def store_group(indices: List[int]) -> None:
+            for index in indices:
+                results[index] = self.memory_store(*entries[index])
+
+        if len(groups) <= 1 or max_workers <= 1:
+            for indices in groups.values():
+                store_group(indices)
+        else:
+            # Resolve availability once rather than racing the check in workers
+            self._check_mcp_availability()
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(groups))) as executor:
+                list(executor.map(store_group, groups.values()))
+
+        return results
+
     def vector_search(
         self,
         query: str,
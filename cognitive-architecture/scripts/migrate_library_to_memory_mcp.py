@@ -18,59 +18,203 @@ import os
 import sys
 import json
 import glob
+import mmap
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple, Union
 
 # Add parent paths for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from integration.json_io import dumps_json as _dumps_json
 from optimization.mcp_client import get_mcp_client, MemoryMCPClient
 
+# Prefer orjson for library files when installed (perf extra)
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+
+def _loads_json(data: Union[bytes, str]) -> Any:
+    """
+    Parse JSON bytes or text, using orjson when available.
+
+    Falls back to the stdlib for documents orjson rejects but json accepts
+    (NaN/Infinity literals, integers beyond 64 bits).
+    """
+    if _orjson is not None:
+        try:
+            return _orjson.loads(data)
+        except _orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+# Files at least this large are memory-mapped rather than read into a
+# bytes copy; below it the mmap setup costs more than the copy
+_MMAP_MIN_BYTES = 64 * 1024
+
+
+def _read_json(path: Union[str, Path]) -> Any:
+    """
+    Load a JSON file.
+
+    With orjson installed, large files are parsed straight from a read-only
+    memory map, so the kernel pages them in without a heap copy.
+    """
+    with open(path, "rb") as f:
+        if _orjson is not None and os.fstat(f.fileno()).st_size >= _MMAP_MIN_BYTES:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    try:
+                        return _orjson.loads(view)
+                    except _orjson.JSONDecodeError:
+                        pass
+                return json.loads(mm[:])
+        return _loads_json(f.read())
+
+
+def _store_value(value: Any) -> Any:
+    """
+    Pre-serialize a dict for memory_store with orjson when available.
+
+    memory_store JSON-encodes dict values with the stdlib; handing it the
+    orjson text instead skips that pass. Values orjson cannot encode
+    exactly (integers beyond 64 bits, and NaN/Infinity, which it writes as
+    null, so any null falls back) are returned unchanged.
+    """
+    if _orjson is None or not isinstance(value, dict):
+        return value
+    try:
+        data = _orjson.dumps(value)
+    except TypeError:
+        return value
+    if b"null" in data:
+        return value
+    return data.decode()
+
+
+# Optimization run directories under storage/, in migration order
+_OPTIMIZATION_RUNS = ("real_optimization", "two_stage_optimization")
+
+# Constant WHO/PROJECT/WHY tags per migrated category. WHEN is filled in
+# per run; the placeholder keeps the tags in WHO/WHEN/PROJECT/WHY order
+_NAMED_MODES_META = {
+    "WHO": "library-migrator:named_modes",
+    "WHEN": None,
+    "PROJECT": "cognitive-architecture",
+    "WHY": "optimization",
+}
+_METALOOP_META = {
+    "WHO": "library-migrator:metaloop",
+    "WHEN": None,
+    "PROJECT": "cognitive-architecture",
+    "WHY": "optimization",
+}
+_POLICY_META = {
+    "WHO": "library-migrator:policy",
+    "WHEN": None,
+    "PROJECT": "cognitive-architecture",
+    "WHY": "governance",
+}
+_PARETO_META = {
+    "WHO": "library-migrator:pareto",
+    "WHEN": None,
+    "PROJECT": "cognitive-architecture",
+    "WHY": "optimization",
+}
+_EVALUATIONS_META = {
+    "WHO": "library-migrator:evaluations",
+    "WHEN": None,
+    "PROJECT": "cognitive-architecture",
+    "WHY": "evaluation",
+}
+
 
 class LibraryMigrator:
     """Migrates cognitive architecture library to Memory MCP."""
 
-    def __init__(self, base_dir: Optional[Path] = None):
+    __slots__ = (
+        "base_dir",
+        "storage_dir",
+        "integration_dir",
+        "tasks_dir",
+        "evals_dir",
+        "client",
+        "migration_log",
+        "_log_lock",
+        "_when",
+        "_named_modes_paths",
+        "_pareto_paths",
+        "_metaloop_path",
+        "_policy_paths",
+    )
+
+    def __init__(self, base_dir: Optional[Path] = None) -> None:
         self.base_dir = base_dir or Path(__file__).parent.parent
         self.storage_dir = self.base_dir / "storage"
         self.integration_dir = self.base_dir / "integration"
         self.tasks_dir = self.base_dir / "tasks"
         self.evals_dir = self.base_dir / "evals"
 
+        # Source files as plain strings, built once rather than per call
+        storage = str(self.storage_dir)
+        integration = str(self.integration_dir)
+        self._named_modes_paths = tuple(
+            os.path.join(storage, source, "named_modes.json") for source in _OPTIMIZATION_RUNS
+        )
+        self._pareto_paths = tuple(
+            (source, os.path.join(storage, source, "pareto_frontier.json")) for source in _OPTIMIZATION_RUNS
+        )
+        self._metaloop_path = os.path.join(integration, "metaloop_optimization_results.json")
+        self._policy_paths = (
+            os.path.join(integration, ".loop", "policy.json"),
+            os.path.join(storage, "policy.json"),
+        )
+
         self.client = get_mcp_client(namespace="cognitive-architecture/library")
-        self.migration_log = []
+        self.migration_log: List[str] = []
+        self._log_lock = threading.Lock()
+        # WHEN tag shared by every entry of a migration run
+        self._when = datetime.now().isoformat()
 
     def migrate_all_tier1(self) -> Dict[str, Any]:
         """Migrate all Tier 1 (High Value) data."""
-        results = {
-            "timestamp": datetime.now().isoformat(),
+        self._when = datetime.now().isoformat()
+        results: Dict[str, Any] = {
+            "timestamp": self._when,
             "tier": 1,
             "migrations": {}
         }
 
-        # 1. Named Modes (Pareto-optimal configurations)
-        results["migrations"]["named_modes"] = self._migrate_named_modes()
-
-        # 2. MetaLoop Optimization Results
-        results["migrations"]["metaloop_results"] = self._migrate_metaloop_results()
-
-        # 3. Policy/Governance Rules
-        results["migrations"]["policy"] = self._migrate_policy()
+        tasks = [
+            # 1. Named Modes (Pareto-optimal configurations)
+            ("named_modes", self._migrate_named_modes),
+            # 2. MetaLoop Optimization Results
+            ("metaloop_results", self._migrate_metaloop_results),
+            # 3. Policy/Governance Rules
+            ("policy", self._migrate_policy),
+            # 4. Pareto Frontier
+            ("pareto_frontier", self._migrate_pareto_frontier),
+            # 5. Eval Results (sample - most recent 5)
+            ("eval_results", lambda: self._migrate_eval_results(limit=5)),
+        ]
 
-        # 4. Pareto Frontier
-        results["migrations"]["pareto_frontier"] = self._migrate_pareto_frontier()
+        # The categories store disjoint keys and are bound by file and MCP
+        # I/O, so they run concurrently
+        with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+            futures = [(name, executor.submit(fn)) for name, fn in tasks]
+            for name, future in futures:
+                results["migrations"][name] = future.result()
 
-        # 5. Eval Results (sample - most recent 5)
-        results["migrations"]["eval_results"] = self._migrate_eval_results(limit=5)
-
-        # Summary
-        total_stored = sum(
-            m.get("stored_count", 0) for m in results["migrations"].values()
-        )
-        total_errors = sum(
-            m.get("error_count", 0) for m in results["migrations"].values()
-        )
+        # Summary (one pass over the per-category results)
+        total_stored = total_errors = 0
+        for m in results["migrations"].values():
+            total_stored += m.get("stored_count", 0)
+            total_errors += m.get("error_count", 0)
 
         results["summary"] = {
             "total_stored": total_stored,
@@ -80,73 +224,65 @@ class LibraryMigrator:
 
         return results
 
+    def _log(self, entry: str) -> None:
+        """Append to the migration log (categories migrate concurrently)."""
+        with self._log_lock:
+            self.migration_log.append(entry)
+
     def _migrate_named_modes(self) -> Dict[str, Any]:
         """Migrate named_modes.json - Pareto-optimal configurations."""
-        paths = [
-            self.storage_dir / "real_optimization" / "named_modes.json",
-            self.storage_dir / "two_stage_optimization" / "named_modes.json",
-        ]
-
-        stored = 0
-        errors = 0
-
-        for path in paths:
-            if not path.exists():
-                continue
+        stored: int = 0
+        errors: int = 0
+        entries: List[Tuple[str, Any, Dict[str, Any]]] = []
+        base_meta = {**_NAMED_MODES_META, "WHEN": self._when}
+        add_entry = entries.append
 
+        for path in self._named_modes_paths:
             try:
-                data = json.loads(path.read_text())
+                data = _read_json(path)
                 modes = data.get("modes", data) if isinstance(data, dict) else data
+                source_file = os.path.basename(path)
 
                 # Store each mode separately for granular retrieval
                 for mode_name, mode_config in modes.items():
                     key = f"named_modes/{mode_name}"
-                    metadata = {
-                        "WHO": "library-migrator:named_modes",
-                        "WHEN": datetime.now().isoformat(),
-                        "PROJECT": "cognitive-architecture",
-                        "WHY": "optimization",
-                        "x-mode-name": mode_name,
-                        "x-source-file": str(path.name),
-                    }
-
-                    result = self.client.memory_store(key, mode_config, metadata)
-                    if result.success:
-                        stored += 1
-                    else:
-                        errors += 1
-                        self.migration_log.append(f"Error storing {key}: {result.error}")
+                    metadata = base_meta.copy()
+                    metadata["x-mode-name"] = mode_name
+                    metadata["x-source-file"] = source_file
+                    add_entry((key, _store_value(mode_config), metadata))
 
+            except (FileNotFoundError, NotADirectoryError):
+                continue
             except Exception as e:
                 errors += 1
-                self.migration_log.append(f"Error processing {path}: {e}")
+                self._log(f"Error processing {path}: {e}")
+
+        # One batch for all modes, so store round-trips overlap
+        for (key, _, _), result in zip(entries, self.client.memory_store_batch(entries)):
+            if result.success:
+                stored += 1
+            else:
+                errors += 1
+                self._log(f"Error storing {key}: {result.error}")
 
         return {"stored_count": stored, "error_count": errors}
 
     def _migrate_metaloop_results(self) -> Dict[str, Any]:
         """Migrate metaloop optimization iteration results."""
-        path = self.integration_dir / "metaloop_optimization_results.json"
-
-        if not path.exists():
-            return {"stored_count": 0, "error_count": 0, "message": "File not found"}
+        path = self._metaloop_path
 
         try:
-            data = json.loads(path.read_text())
-
-            # Handle both list and dict formats
-            iterations_count = len(data) if isinstance(data, list) else len(data.get("iterations", []))
+            data = _read_json(path)
 
-            # Wrap list in dict for consistent storage
-            store_data = {"iterations": data} if isinstance(data, list) else data
+            # Handle both list and dict formats (lists are wrapped in a
+            # dict for consistent storage)
+            if isinstance(data, list):
+                iterations_count, store_data = len(data), {"iterations": data}
+            else:
+                iterations_count, store_data = len(data.get("iterations", [])), data
 
             key = "metaloop/optimization_results"
-            metadata = {
-                "WHO": "library-migrator:metaloop",
-                "WHEN": datetime.now().isoformat(),
-                "PROJECT": "cognitive-architecture",
-                "WHY": "optimization",
-                "x-iterations": str(iterations_count),
-            }
+            metadata = {**_METALOOP_META, "WHEN": self._when, "x-iterations": str(iterations_count)}
 
             result = self.client.memory_store(key, store_data, metadata)
             return {
@@ -154,31 +290,26 @@ class LibraryMigrator:
                 "error_count": 0 if result.success else 1,
             }
 
+        except (FileNotFoundError, NotADirectoryError):
+            return {"stored_count": 0, "error_count": 0, "message": "File not found"}
         except Exception as e:
             return {"stored_count": 0, "error_count": 1, "error": str(e)}
 
     def _migrate_policy(self) -> Dict[str, Any]:
         """Migrate governance policy."""
-        paths = [
-            self.integration_dir / ".loop" / "policy.json",
-            self.storage_dir / "policy.json",
-        ]
-
-        for path in paths:
-            if not path.exists():
-                continue
-
+        for path in self._policy_paths:
             try:
-                data = json.loads(path.read_text())
+                data = _read_json(path)
+
+                regression_threshold = data.get("regression_threshold", 0.03)
+                max_iterations = data.get("max_iterations", 50)
 
                 key = "governance/policy"
                 metadata = {
-                    "WHO": "library-migrator:policy",
-                    "WHEN": datetime.now().isoformat(),
-                    "PROJECT": "cognitive-architecture",
-                    "WHY": "governance",
-                    "x-regression-threshold": str(data.get("regression_threshold", 0.03)),
-                    "x-max-iterations": str(data.get("max_iterations", 50)),
+                    **_POLICY_META,
+                    "WHEN": self._when,
+                    "x-regression-threshold": f"{regression_threshold}",
+                    "x-max-iterations": f"{max_iterations}",
                 }
 
                 result = self.client.memory_store(key, data, metadata)
@@ -187,6 +318,8 @@ class LibraryMigrator:
                     "error_count": 0 if result.success else 1,
                 }
 
+            except (FileNotFoundError, NotADirectoryError):
+                continue
             except Exception as e:
                 return {"stored_count": 0, "error_count": 1, "error": str(e)}
 
@@ -194,47 +327,40 @@ class LibraryMigrator:
 
     def _migrate_pareto_frontier(self) -> Dict[str, Any]:
         """Migrate Pareto frontier results."""
-        paths = [
-            self.storage_dir / "real_optimization" / "pareto_frontier.json",
-            self.storage_dir / "two_stage_optimization" / "pareto_frontier.json",
-        ]
-
-        stored = 0
-        errors = 0
-
-        for path in paths:
-            if not path.exists():
-                continue
+        stored: int = 0
+        errors: int = 0
+        entries: List[Tuple[str, Any, Dict[str, Any]]] = []
+        base_meta = {**_PARETO_META, "WHEN": self._when}
 
+        for source, path in self._pareto_paths:
             try:
-                data = json.loads(path.read_text())
+                data = _read_json(path)
 
-                # Handle both list and dict formats
-                solutions_count = len(data) if isinstance(data, list) else len(data.get("solutions", data.get("frontier", [])))
+                # Handle both list and dict formats (lists are wrapped in a
+                # dict for consistent storage)
+                if isinstance(data, list):
+                    solutions_count, store_data = len(data), {"frontier": data}
+                else:
+                    solutions_count = len(data.get("solutions", data.get("frontier", [])))
+                    store_data = data
 
-                source = path.parent.name
                 key = f"optimization/pareto_frontier_{source}"
-                metadata = {
-                    "WHO": "library-migrator:pareto",
-                    "WHEN": datetime.now().isoformat(),
-                    "PROJECT": "cognitive-architecture",
-                    "WHY": "optimization",
-                    "x-source": source,
-                    "x-solutions-count": str(solutions_count),
-                }
-
-                # Wrap list in dict for consistent storage
-                store_data = {"frontier": data} if isinstance(data, list) else data
-
-                result = self.client.memory_store(key, store_data, metadata)
-                if result.success:
-                    stored += 1
-                else:
-                    errors += 1
+                metadata = base_meta.copy()
+                metadata["x-source"] = source
+                metadata["x-solutions-count"] = str(solutions_count)
+                entries.append((key, _store_value(store_data), metadata))
 
+            except (FileNotFoundError, NotADirectoryError):
+                continue
             except Exception as e:
                 errors += 1
-                self.migration_log.append(f"Error processing {path}: {e}")
+                self._log(f"Error processing {path}: {e}")
+
+        for result in self.client.memory_store_batch(entries):
+            if result.success:
+                stored += 1
+            else:
+                errors += 1
 
         return {"stored_count": stored, "error_count": errors}
 
@@ -242,48 +368,64 @@ class LibraryMigrator:
         """Migrate evaluation results (most recent N)."""
         eval_dir = self.storage_dir / "eval_results"
 
-        if not eval_dir.exists():
+        # Get most recent eval files (one scandir, mtimes from its entries)
+        try:
+            with os.scandir(eval_dir) as it:
+                candidates = [
+                    (entry.stat().st_mtime, entry.path)
+                    for entry in it
+                    if os.path.normcase(entry.name).endswith(".json")
+                ]
+        except (FileNotFoundError, NotADirectoryError):
             return {"stored_count": 0, "error_count": 0, "message": "Eval results dir not found"}
+        candidates.sort(key=lambda c: c[0], reverse=True)
+        eval_files = [Path(p) for _, p in candidates[:limit]]
 
-        # Get most recent eval files
-        eval_files = sorted(eval_dir.glob("*.json"), key=lambda p: p.stat().st_mtime, reverse=True)[:limit]
+        stored: int = 0
+        errors: int = 0
+        base_meta = {**_EVALUATIONS_META, "WHEN": self._when}
 
-        stored = 0
-        errors = 0
+        # Bound once for the loop below
+        store = self.client.memory_store
+        log = self._log
 
         for path in eval_files:
             try:
-                data = json.loads(path.read_text())
+                # Parsed so malformed reports fail here, with their path.
+                # memory_store would only serialize an object back to text,
+                # so objects are forwarded as the file's own text instead
+                raw = path.read_bytes().decode("utf-8-sig").strip()
+                data = _loads_json(raw)
+                if isinstance(data, dict):
+                    data = raw
 
                 # Extract skill name from filename (e.g., prompt-architect-eval-20260101-171411.json)
                 filename = path.stem
-                parts = filename.split("-")
-                skill_name = "-".join(parts[:-4]) if len(parts) > 4 else parts[0]
+                # Skill is the stem minus its last four dash-separated fields;
+                # rsplit only splits those off instead of splitting every dash
+                head = filename.rsplit("-", 4)
+                skill_name = head[0] if len(head) == 5 else filename.partition("-")[0]
 
                 key = f"evaluations/{filename}"
-                metadata = {
-                    "WHO": "library-migrator:evaluations",
-                    "WHEN": datetime.now().isoformat(),
-                    "PROJECT": "cognitive-architecture",
-                    "WHY": "evaluation",
-                    "x-skill": skill_name,
-                    "x-filename": filename,
-                }
+                metadata = base_meta.copy()
+                metadata["x-skill"] = skill_name
+                metadata["x-filename"] = filename
 
-                result = self.client.memory_store(key, data, metadata)
+                result = store(key, data, metadata)
                 if result.success:
                     stored += 1
                 else:
                     errors += 1
+                    log(f"Error storing {key}: {result.error}")
 
             except Exception as e:
                 errors += 1
-                self.migration_log.append(f"Error processing {path}: {e}")
+                log(f"Error processing {path}: {e}")
 
         return {"stored_count": stored, "error_count": errors}
 
 
-def main():
+def main() -> Dict[str, Any]:
     """Run the migration."""
     print("=" * 60)
     print("Library to Memory MCP Migration")
@@ -311,7 +453,9 @@ def main():
 
     # Save migration report
     report_path = Path(__file__).parent.parent / "storage" / "migration_report.json"
-    report_path.write_text(json.dumps(results, indent=2))
+    tmp_path = report_path.with_name(report_path.name + ".tmp")
+    tmp_path.write_bytes(_dumps_json(results))
+    os.replace(tmp_path, report_path)
     print(f"\nReport saved to: {report_path}")
 
     return results
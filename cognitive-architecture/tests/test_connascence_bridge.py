@@ -0,0 +1,755 @@
+"""
+Tests for integration/connascence_bridge.py
+
+Tests:
+- Heuristic (mock) analysis of files and directories
+- Mode detection leaves sys.path untouched
+- CLI mode via persistent worker and one-shot fallback
+- Estimate caching by content digest
+- Analysis caching by file/directory fingerprint
+- Persistent result store invalidated by stat stamps
+- Batch path and artifact analysis
+- ConnascenceResult gate and serialization
+"""
+
+import sys
+import textwrap
+import pytest
+from pathlib import Path
+
+from integration import connascence_bridge
+from integration.connascence_bridge import (
+    ConnascenceBridge,
+    ConnascenceResult,
+    analyze_artifact,
+    analyze_artifacts,
+)
+
+
+SAMPLE_SOURCE = '''
+def handler(value):
+    if value > 1000:
+        raise ValueError("too large")
+    return value * 2
+'''
+
+
+@pytest.fixture
+def bridge(tmp_path):
+    """Bridge pointed at an empty directory so it always runs in mock mode."""
+    connascence_bridge._ESTIMATE_CACHE.clear()
+    connascence_bridge._ANALYSIS_CACHE.clear()
+    bridge = ConnascenceBridge(connascence_path=tmp_path / "missing-connascence")
+    assert bridge.mode == "mock"
+    return bridge
+
+
+class TestModeDetection:
+    """Tests for invocation mode detection."""
+
+    def test_detect_mode_does_not_leak_sys_path(self, tmp_path):
+        """A failed direct import must not leave the project on sys.path."""
+        before = list(sys.path)
+        ConnascenceBridge(connascence_path=tmp_path)
+        assert sys.path == before
+
+
+FAKE_CLI = textwrap.dedent('''
+    import json, os, sys
+
+    SERVE = {serve}
+
+    def report(path):
+        return {{
+            "sigma_level": 5.0, "dpmo": 100.0, "nasa_compliance": 1.0,
+            "mece_score": 0.9, "theater_risk": 0.0, "clarity_score": 0.9,
+            "total_violations": 0, "critical_violations": 0,
+            "pid": os.getpid(), "path": path,
+        }}
+
+    if sys.argv[1:] == ["--serve-stdio"]:
+        if not SERVE:
+            sys.exit(2)
+        for line in sys.stdin:
+            path = json.loads(line)["path"]
+            if path.endswith("bad.py"):
+                print(json.dumps({{"error": "cannot analyze", "path": path}}), flush=True)
+            else:
+                print(json.dumps(report(path)), flush=True)
+    elif sys.argv[1] == "analyze":
+        # A FAIL file in the project root simulates a broken CLI run
+        if os.path.exists("FAIL"):
+            sys.exit(1)
+        print(json.dumps(report(sys.argv[2])))
+''')
+
+
+def make_fake_cli(root: Path, serve: bool) -> Path:
+    """Create a project that looks like a connascence checkout to the bridge."""
+    (root / "src").mkdir(parents=True)
+    (root / "src" / "cli_handlers.py").write_text("")
+    (root / "connascence").mkdir()
+    (root / "connascence" / "__init__.py").write_text("")
+    (root / "connascence" / "__main__.py").write_text(FAKE_CLI.format(serve=serve))
+    return root
+
+
+class TestCliMode:
+    """Tests for CLI invocation through the persistent worker."""
+
+    @pytest.fixture(autouse=True)
+    def clear_caches(self):
+        connascence_bridge._ANALYSIS_CACHE.clear()
+        connascence_bridge._WORKER_UNSUPPORTED.clear()
+
+    def test_worker_is_reused_across_files(self, tmp_path):
+        """A running worker should also answer later single-file requests."""
+        bridge = ConnascenceBridge(make_fake_cli(tmp_path / "conn", serve=True))
+        assert bridge.mode == "cli"
+        a = tmp_path / "a.py"
+        b = tmp_path / "b.py"
+        c = tmp_path / "c.py"
+        a.write_text("a = 1")
+        b.write_text("b = 2")
+        c.write_text("c = 3")
+
+        try:
+            first, _ = bridge.analyze_paths([a, b])
+            later = bridge.analyze_file(c)
+        finally:
+            bridge.close()
+
+        assert first.success and later.success
+        assert first.raw_output["path"] == str(a)
+        assert first.raw_output["pid"] == later.raw_output["pid"]
+
+    def test_single_path_does_not_start_worker(self, tmp_path):
+        """One-off analyses should go straight to the one-shot CLI."""
+        bridge = ConnascenceBridge(make_fake_cli(tmp_path / "conn", serve=True))
+        source = tmp_path / "a.py"
+        source.write_text("a = 1")
+
+        result = bridge.analyze_file(source)
+
+        assert result.success
+        assert bridge._worker is None
+
+    def test_error_replies_fall_back_to_oneshot(self, tmp_path):
+        """A worker error reply should be retried for that path, not trusted."""
+        bridge = ConnascenceBridge(make_fake_cli(tmp_path / "conn", serve=True))
+        good = tmp_path / "good.py"
+        bad = tmp_path / "bad.py"
+        good.write_text("a = 1")
+        bad.write_text("b = 2")
+
+        try:
+            results = bridge.analyze_paths([good, bad])
+        finally:
+            bridge.close()
+
+        assert all(r.success for r in results)
+        assert results[1].raw_output["path"] == str(bad)
+        assert "error" not in results[1].raw_output
+        assert results[0].raw_output["pid"] != results[1].raw_output["pid"]
+
+    def test_analyze_paths_pipelines_one_batch(self, tmp_path):
+        """A batch should be answered in order by a single worker process."""
+        bridge = ConnascenceBridge(make_fake_cli(tmp_path / "conn", serve=True))
+        sources = []
+        for i in range(5):
+            source = tmp_path / f"m{i}.py"
+            source.write_text(f"m = {i}")
+            sources.append(source)
+
+        try:
+            results = bridge.analyze_paths(sources)
+        finally:
+            bridge.close()
+
+        assert [r.raw_output["path"] for r in results] == [str(s) for s in sources]
+        assert len({r.raw_output["pid"] for r in results}) == 1
+
+    def test_falls_back_to_oneshot_without_serve_stdio(self, tmp_path):
+        """CLIs without --serve-stdio should still be usable."""
+        root = make_fake_cli(tmp_path / "conn", serve=False)
+        bridge = ConnascenceBridge(root)
+        sources = [tmp_path / "a.py", tmp_path / "b.py"]
+        for source in sources:
+            source.write_text("a = 1")
+
+        try:
+            results = bridge.analyze_paths(sources)
+        finally:
+            bridge.close()
+
+        assert all(r.success and r.sigma_level == 5.0 for r in results)
+        assert bridge._worker_key in connascence_bridge._WORKER_UNSUPPORTED
+        # Later bridges over the same CLI skip the failed worker start
+        assert ConnascenceBridge(root)._get_worker() is None
+
+    def test_mock_fallback_is_not_cached(self, tmp_path):
+        """A mock answer for a failed CLI run is retried, not memoized."""
+        root = make_fake_cli(tmp_path / "conn", serve=False)
+        bridge = ConnascenceBridge(root)
+        source = tmp_path / "a.py"
+        source.write_text(SAMPLE_SOURCE)
+
+        (root / "FAIL").write_text("")
+        fallback = bridge.analyze_file(source)
+        (root / "FAIL").unlink()
+        recovered = bridge.analyze_file(source)
+
+        assert fallback.success
+        assert fallback.error.startswith("fallback: ")
+        assert recovered.error is None
+        assert recovered.sigma_level == 5.0
+
+    def test_oneshot_batch_runs_concurrently(self, tmp_path):
+        """Without a worker, a batch should fan out one-shot runs on threads."""
+        import threading
+
+        bridge = ConnascenceBridge(make_fake_cli(tmp_path / "conn", serve=False))
+        connascence_bridge._WORKER_UNSUPPORTED.add(bridge._worker_key)
+        sources = [tmp_path / f"m{i}.py" for i in range(4)]
+        for source in sources:
+            source.write_text("m = 1")
+
+        threads = set()
+        original = bridge._analyze_cli_oneshot
+
+        def recording(path, policy):
+            threads.add(threading.get_ident())
+            return original(path, policy)
+
+        bridge._analyze_cli_oneshot = recording
+        results = bridge.analyze_paths(sources, workers=4)
+
+        assert [r.raw_output["path"] for r in results] == [str(s) for s in sources]
+        assert threading.get_ident() not in threads
+
+    def test_analyze_paths_falls_back_to_oneshot(self, tmp_path):
+        """Batches should still be analyzed one process per path without a worker."""
+        bridge = ConnascenceBridge(make_fake_cli(tmp_path / "conn", serve=False))
+        a = tmp_path / "a.py"
+        b = tmp_path / "b.py"
+        a.write_text("a = 1")
+        b.write_text("b = 2")
+
+        try:
+            results = bridge.analyze_paths([a, b])
+        finally:
+            bridge.close()
+
+        assert [r.raw_output["path"] for r in results] == [str(a), str(b)]
+
+
+class TestMockAnalysis:
+    """Tests for heuristic analysis when the analyzer is absent."""
+
+    def test_analyze_file(self, bridge, tmp_path):
+        """Should produce a successful result for a readable file."""
+        source = tmp_path / "sample.py"
+        source.write_text(SAMPLE_SOURCE)
+
+        result = bridge.analyze_file(source)
+
+        assert result.success
+        assert result.violations_count == 1  # one magic number
+        assert result.sigma_level > 0
+
+    def test_analyze_missing_path(self, bridge, tmp_path):
+        """Missing paths should return an unsuccessful result."""
+        result = bridge.analyze_file(tmp_path / "nope.py")
+        assert not result.success
+        assert result.error == "Path not found"
+
+    def test_analyze_directory(self, bridge, tmp_path):
+        """Directory analysis should aggregate across .py files."""
+        (tmp_path / "pkg").mkdir()
+        (tmp_path / "pkg" / "a.py").write_text(SAMPLE_SOURCE)
+        (tmp_path / "pkg" / "b.py").write_text(SAMPLE_SOURCE)
+        (tmp_path / "pkg" / "notes.txt").write_text("x = 99999")
+
+        result = bridge.analyze_directory(tmp_path / "pkg")
+
+        assert result.success
+        assert result.violations_count == 2
+
+    def test_streamed_large_file_matches_in_memory(self, bridge, tmp_path, monkeypatch):
+        """Line-by-line scanning of large files should give identical metrics."""
+        source = tmp_path / "big.py"
+        source.write_text(
+            "# TODO tidy\r\n" + SAMPLE_SOURCE * 40 + "    " * 8 + "x = ...\nexcept:\n" * 3
+        )
+
+        in_memory = bridge._estimate_quality_uncached(
+            source.read_text(errors="ignore"), "standard"
+        )
+        monkeypatch.setattr(connascence_bridge, "_STREAM_MIN_BYTES", 0)
+        streamed = bridge._analyze_mock(source, "standard")
+
+        assert streamed == in_memory
+        assert streamed.theater_risk > 0
+
+    def test_mmap_large_file_matches_in_memory(self, bridge, tmp_path, monkeypatch):
+        """Scanning a large ASCII file through mmap should give identical metrics."""
+        pytest.importorskip("numpy")
+        source = tmp_path / "big.py"
+        source.write_text(
+            "# TODO tidy\n" + SAMPLE_SOURCE * 40 + ("    " * 8 + "x = ...\nexcept:\n") * 3
+        )
+
+        assert connascence_bridge._mmap_estimate_counts(source) is not None
+        in_memory = bridge._estimate_quality_uncached(source.read_text(), "standard")
+        monkeypatch.setattr(connascence_bridge, "_STREAM_MIN_BYTES", 0)
+        mapped = bridge._analyze_mock(source, "standard")
+
+        assert mapped == in_memory
+        assert mapped.theater_risk > 0
+
+    def test_mmap_skips_content_that_needs_decoding(self, tmp_path):
+        """Non-ASCII or CRLF files should be left to the decoding scanner."""
+        source = tmp_path / "crlf.py"
+        source.write_bytes(b"x = 1\r\ny = 2\r\n")
+        assert connascence_bridge._mmap_estimate_counts(source) is None
+
+    @pytest.mark.parametrize("data", [
+        SAMPLE_SOURCE.encode(),
+        b"\x1c\x1f  x = 1\n\tdef f():\n" + b" " * 30 + b"TODO\n",
+        b"x = 1\r\ny = 2\r\n",
+        "caf\u00e9 = 1000\n".encode(),
+    ])
+    def test_bytes_fast_path_matches_text(self, bridge, tmp_path, data):
+        """ASCII files scanned as bytes should match the decoded-text estimate."""
+        source = tmp_path / "sample.py"
+        source.write_bytes(data)
+
+        expected = bridge._estimate_quality_uncached(source.read_text(errors="ignore"), "standard")
+
+        assert bridge._analyze_mock(source, "standard") == expected
+
+    @pytest.fixture
+    def scan_pool(self, monkeypatch):
+        """Fresh shared scan pool state, shut down after the test."""
+        monkeypatch.setattr(connascence_bridge, "_scan_pool", None)
+        monkeypatch.setattr(connascence_bridge, "_scan_pool_failed", False)
+        monkeypatch.setattr(connascence_bridge, "_PARALLEL_SCAN_MIN_FILES", 1)
+        yield
+        if connascence_bridge._scan_pool is not None:
+            connascence_bridge._scan_pool.shutdown()
+
+    def serial_scan(self, bridge, path, monkeypatch):
+        monkeypatch.setattr(connascence_bridge, "_PARALLEL_SCAN_MIN_FILES", 10 ** 9)
+        result = bridge._analyze_mock(path, "standard")
+        monkeypatch.setattr(connascence_bridge, "_PARALLEL_SCAN_MIN_FILES", 1)
+        return result
+
+    def test_parallel_directory_scan_matches_serial(self, bridge, tmp_path, scan_pool, monkeypatch):
+        """The process-pool scan should aggregate exactly like the serial one."""
+        for i in range(5):
+            (tmp_path / f"m{i}.py").write_text(SAMPLE_SOURCE * (i + 1))
+
+        serial = self.serial_scan(bridge, tmp_path, monkeypatch)
+        parallel = bridge._analyze_mock(tmp_path, "standard")
+        pool = connascence_bridge._scan_pool
+        assert pool is not None
+        # Capped, and workers are never forked from this threaded process
+        assert pool._max_workers <= connascence_bridge._SCAN_POOL_MAX_WORKERS
+        assert pool._mp_context.get_start_method() != "fork"
+
+        # Bridges built per call share the same pool
+        other = ConnascenceBridge(connascence_path=bridge.connascence_path)
+        other._analyze_mock(tmp_path, "standard")
+        other.close()
+        assert connascence_bridge._scan_pool is pool
+        assert parallel == serial
+
+    def test_broken_scan_pool_falls_back_to_serial(self, bridge, tmp_path, scan_pool, monkeypatch):
+        """A failed pool is dropped and the scan still succeeds serially."""
+        from concurrent.futures.process import BrokenProcessPool
+
+        class BrokenPool:
+            def map(self, *args, **kwargs):
+                raise BrokenProcessPool("worker died")
+
+            def shutdown(self, *args, **kwargs):
+                pass
+
+        for i in range(3):
+            (tmp_path / f"m{i}.py").write_text(SAMPLE_SOURCE)
+        expected = self.serial_scan(bridge, tmp_path, monkeypatch)
+        connascence_bridge._scan_pool = BrokenPool()
+
+        first = bridge._analyze_mock(tmp_path, "standard")
+        second = bridge._analyze_mock(tmp_path, "standard")
+
+        assert first == second == expected
+        assert first.success
+        assert connascence_bridge._scan_pool is None
+        assert connascence_bridge._get_scan_pool() is None
+
+    def test_directory_walk_skips_symlinked_dirs(self, bridge, tmp_path):
+        """Nested .py files are found; symlinked directories are not followed."""
+        pkg = tmp_path / "pkg"
+        (pkg / "sub" / "deeper").mkdir(parents=True)
+        (pkg / "a.py").write_text(SAMPLE_SOURCE)
+        (pkg / "sub" / "deeper" / "b.py").write_text(SAMPLE_SOURCE)
+        (pkg / "sub" / "notes.txt").write_text("x = 99999")
+        try:
+            (pkg / "sub" / "loop").symlink_to(pkg, target_is_directory=True)
+        except OSError:
+            pytest.skip("symlinks not supported")
+
+        found = sorted(entry.name for entry in connascence_bridge._iter_python_files(pkg))
+
+        assert found == ["a.py", "b.py"]
+        assert bridge.analyze_directory(pkg).violations_count == 2
+
+
+class TestViolationIndicators:
+    """Tests for the heuristic violation indicator count."""
+
+    def test_clean_content_has_no_indicators(self, bridge):
+        """Short, shallow code without magic numbers scores zero."""
+        assert bridge._count_violation_indicators("def f(x):\n    return x\n") == 0
+
+    def test_long_lines_and_magic_numbers(self, bridge):
+        """Each long line and each magic number counts once."""
+        content = "x = 1234\n" + "y" * 121 + "\nz = 5678\n"
+        assert bridge._count_violation_indicators(content) == 3
+
+    def test_deep_nesting(self, bridge):
+        """Indentation beyond 20 columns adds max_indent // 4."""
+        content = "def f():\n" + " " * 24 + "return 1\n"
+        assert bridge._count_violation_indicators(content) == 6
+
+    def test_long_functions(self, bridge):
+        """More than 50 lines per def adds one indicator per 50 lines."""
+        content = "def f():\n" + "    x = 1\n" * 120
+        assert bridge._count_violation_indicators(content) == 2
+
+
+    @pytest.mark.parametrize("content", [
+        "",
+        "\n\n  \n",
+        "\t\x0b x\n\x1c\x1f  y\n   \n",
+        " " * 130 + "\n" + "x" * 121,
+        "x\n" + " " * 70 + "y\n" + " " * 200,
+        SAMPLE_SOURCE * 50,
+    ])
+    def test_vectorized_line_stats_match_loop(self, content, monkeypatch):
+        """The numpy line scan should agree with the per-line loop."""
+        pytest.importorskip("numpy")
+        monkeypatch.setattr(connascence_bridge, "_VECTORIZE_MIN_CHARS", 10 ** 12)
+        expected = connascence_bridge._line_shape_stats(content)
+        monkeypatch.setattr(connascence_bridge, "_VECTORIZE_MIN_CHARS", 0)
+        assert connascence_bridge._line_shape_stats(content) == expected
+
+
+class TestDpmoToSigma:
+    """Tests for the DPMO to sigma conversion table."""
+
+    @pytest.mark.parametrize("dpmo,sigma", [
+        (0, 6.0),
+        (3.4, 6.0),
+        (3.5, 5.0),
+        (233, 5.0),
+        (6210, 4.0),
+        (6211, 3.0),
+        (66807, 3.0),
+        (308538, 2.0),
+        (691462, 1.0),
+        (691463, 0.0),
+        (1_000_000, 0.0),
+    ])
+    def test_thresholds_are_inclusive(self, bridge, dpmo, sigma):
+        """Each threshold belongs to the higher sigma level."""
+        assert bridge._dpmo_to_sigma(dpmo) == sigma
+
+
+class TestEstimateCache:
+    """Tests for the content-digest estimate cache."""
+
+    def test_identical_content_hits_cache(self, bridge, monkeypatch):
+        """Identical content should only be scanned once."""
+        calls = []
+        original = ConnascenceBridge._estimate_quality_uncached
+
+        def counting(self, content, policy):
+            calls.append(content)
+            return original(self, content, policy)
+
+        monkeypatch.setattr(ConnascenceBridge, "_estimate_quality_uncached", counting)
+
+        first = bridge._estimate_quality(SAMPLE_SOURCE, "standard")
+        second = bridge._estimate_quality(SAMPLE_SOURCE, "standard")
+
+        assert len(calls) == 1
+        assert first == second
+
+    def test_policy_is_part_of_key(self, bridge, monkeypatch):
+        """Different policies should not share cache entries."""
+        calls = []
+        original = ConnascenceBridge._estimate_quality_uncached
+
+        def counting(self, content, policy):
+            calls.append(policy)
+            return original(self, content, policy)
+
+        monkeypatch.setattr(ConnascenceBridge, "_estimate_quality_uncached", counting)
+
+        bridge._estimate_quality(SAMPLE_SOURCE, "standard")
+        bridge._estimate_quality(SAMPLE_SOURCE, "strict")
+
+        assert calls == ["standard", "strict"]
+
+    def test_bytes_and_text_share_entries(self, bridge, monkeypatch):
+        """An ASCII estimate cached from bytes should serve the same text."""
+        first = bridge._estimate_quality_bytes(SAMPLE_SOURCE.encode(), "standard")
+        monkeypatch.setattr(
+            ConnascenceBridge, "_estimate_quality_uncached",
+            lambda self, content, policy: pytest.fail("cached estimate was recomputed"),
+        )
+
+        assert bridge._estimate_quality(SAMPLE_SOURCE, "standard") == first
+
+
+class TestAnalysisCache:
+    """Tests for the fingerprint-keyed analysis cache."""
+
+    @pytest.fixture
+    def calls(self, monkeypatch):
+        calls = []
+        original = ConnascenceBridge._analyze
+
+        def counting(self, path, policy, *args):
+            calls.append(path)
+            return original(self, path, policy, *args)
+
+        monkeypatch.setattr(ConnascenceBridge, "_analyze", counting)
+        return calls
+
+    def test_unchanged_file_is_not_reanalyzed(self, bridge, tmp_path, calls):
+        """A second analysis of the same bytes should come from cache."""
+        source = tmp_path / "sample.py"
+        source.write_text(SAMPLE_SOURCE)
+
+        first = bridge.analyze_file(source)
+        second = bridge.analyze_file(source)
+
+        assert len(calls) == 1
+        assert first == second
+
+    def test_changed_file_is_reanalyzed(self, bridge, tmp_path, calls):
+        """Editing the file should invalidate its cache entry."""
+        source = tmp_path / "sample.py"
+        source.write_text(SAMPLE_SOURCE)
+        bridge.analyze_file(source)
+
+        source.write_text(SAMPLE_SOURCE + "\nLIMIT = 99999\n")
+        result = bridge.analyze_file(source)
+
+        assert len(calls) == 2
+        assert result.violations_count == 2
+
+    def test_directory_cache_tracks_new_files(self, bridge, tmp_path, calls):
+        """Adding a .py file should invalidate the directory entry."""
+        (tmp_path / "a.py").write_text(SAMPLE_SOURCE)
+        bridge.analyze_directory(tmp_path)
+        bridge.analyze_directory(tmp_path)
+        assert len(calls) == 1
+
+        (tmp_path / "b.py").write_text(SAMPLE_SOURCE)
+        result = bridge.analyze_directory(tmp_path)
+
+        assert len(calls) == 2
+        assert result.violations_count == 2
+
+    @pytest.mark.parametrize("data", [SAMPLE_SOURCE.encode(), b"x = 1000\r\ny = 2\r\n"])
+    def test_cache_miss_reads_small_file_once(self, bridge, tmp_path, monkeypatch, data):
+        """Mock analysis reuses the bytes read for the fingerprint."""
+        source = tmp_path / "sample.py"
+        source.write_bytes(data)
+        expected = bridge._estimate_quality_uncached(source.read_text(errors="ignore"), "standard")
+
+        def fail(*args, **kwargs):
+            pytest.fail("file was read twice")
+
+        monkeypatch.setattr(connascence_bridge, "_path_fingerprint", fail)
+        monkeypatch.setattr(Path, "read_bytes", fail)
+
+        assert bridge.analyze_file(source) == expected
+
+    def test_failures_are_not_cached(self, bridge, tmp_path, calls):
+        """Missing paths are re-checked every time."""
+        bridge.analyze_file(tmp_path / "missing.py")
+        bridge.analyze_file(tmp_path / "missing.py")
+        assert len(calls) == 2
+
+    def test_analyze_paths_only_analyzes_misses(self, bridge, tmp_path, calls):
+        """Batches should reuse cached entries and keep input order."""
+        a = tmp_path / "a.py"
+        b = tmp_path / "b.py"
+        a.write_text(SAMPLE_SOURCE)
+        b.write_text("x = 1\n")
+        bridge.analyze_file(a)
+
+        results = bridge.analyze_paths([b, a, tmp_path / "missing.py"])
+
+        assert calls == [a, b, tmp_path / "missing.py"]
+        assert results[0].violations_count == 0
+        assert results[1] == bridge.analyze_file(a)
+        assert not results[2].success
+
+
+class TestPersistentStore:
+    """Tests for the on-disk result store shared across bridges."""
+
+    @pytest.fixture
+    def store_path(self, tmp_path):
+        connascence_bridge._ANALYSIS_CACHE.clear()
+        return tmp_path / ".loop" / "cache" / "connascence.json"
+
+    def make_bridge(self, tmp_path, store_path):
+        return ConnascenceBridge(tmp_path / "missing-connascence", cache_path=store_path)
+
+    def test_results_survive_new_bridge(self, tmp_path, store_path, monkeypatch):
+        """A fresh bridge should reuse stored results for unchanged paths."""
+        (tmp_path / "pkg").mkdir()
+        (tmp_path / "pkg" / "a.py").write_text(SAMPLE_SOURCE)
+        first = self.make_bridge(tmp_path, store_path).analyze_directory(tmp_path / "pkg")
+        assert store_path.exists()
+
+        connascence_bridge._ANALYSIS_CACHE.clear()
+        monkeypatch.setattr(
+            ConnascenceBridge, "_analyze",
+            lambda self, path, policy, *args: pytest.fail("unchanged path was re-analyzed"),
+        )
+        second = self.make_bridge(tmp_path, store_path).analyze_directory(tmp_path / "pkg")
+
+        assert second == first
+
+    def test_changed_tree_is_reanalyzed(self, tmp_path, store_path):
+        """Adding a file changes the stamp and invalidates the stored entry."""
+        (tmp_path / "pkg").mkdir()
+        (tmp_path / "pkg" / "a.py").write_text(SAMPLE_SOURCE)
+        self.make_bridge(tmp_path, store_path).analyze_directory(tmp_path / "pkg")
+
+        (tmp_path / "pkg" / "b.py").write_text(SAMPLE_SOURCE)
+        connascence_bridge._ANALYSIS_CACHE.clear()
+        result = self.make_bridge(tmp_path, store_path).analyze_directory(tmp_path / "pkg")
+
+        assert result.violations_count == 2
+
+    def test_cli_fallback_is_not_persisted(self, tmp_path, store_path):
+        """A transient CLI failure must not pin the mock answer on disk."""
+        connascence_bridge._WORKER_UNSUPPORTED.clear()
+        root = make_fake_cli(tmp_path / "conn", serve=False)
+        source = tmp_path / "a.py"
+        source.write_text(SAMPLE_SOURCE)
+
+        (root / "FAIL").write_text("")
+        fallback = ConnascenceBridge(root, cache_path=store_path).analyze_file(source)
+        (root / "FAIL").unlink()
+        connascence_bridge._ANALYSIS_CACHE.clear()
+        recovered = ConnascenceBridge(root, cache_path=store_path).analyze_file(source)
+
+        assert fallback.error.startswith("fallback: ")
+        assert recovered.error is None
+        assert recovered.sigma_level == 5.0
+
+    def test_store_evicts_oldest_entries(self, tmp_path, store_path):
+        """The store is capped; the oldest writes are dropped first."""
+        store = connascence_bridge._ResultStore(store_path, maxsize=2)
+        result = ConnascenceResult(success=True, sigma_level=4.5)
+        store.put("a", [1, 1, 1], result)
+        store.put("b", [1, 1, 1], result)
+        store.put("a", [2, 1, 1], result)
+        store.put("c", [1, 1, 1], result)
+        store.save()
+
+        saved = connascence_bridge._loads_json(store_path.read_bytes())
+        assert list(saved) == ["a", "c"]
+        reloaded = connascence_bridge._ResultStore(store_path, maxsize=2)
+        assert reloaded.get("a", [2, 1, 1]) == result
+        assert reloaded.get("b", [1, 1, 1]) is None
+
+    def test_corrupt_store_is_ignored(self, tmp_path, store_path):
+        """An unreadable store should be treated as empty and rewritten."""
+        store_path.parent.mkdir(parents=True)
+        store_path.write_text("{not json")
+        source = tmp_path / "a.py"
+        source.write_text(SAMPLE_SOURCE)
+
+        result = self.make_bridge(tmp_path, store_path).analyze_file(source)
+
+        assert result.success
+        assert not list(store_path.parent.glob("*.tmp"))
+        assert connascence_bridge._loads_json(store_path.read_bytes())
+
+
+class TestAnalyzeArtifacts:
+    """Tests for the batch artifact API."""
+
+    def test_results_align_with_inputs(self, tmp_path):
+        """Results should come back in input order, one per path."""
+        good = tmp_path / "good.py"
+        good.write_text(SAMPLE_SOURCE)
+        missing = tmp_path / "missing.py"
+
+        reports = analyze_artifacts([good, missing, good])
+
+        assert len(reports) == 3
+        assert reports[0]["connascence"]["success"] is True
+        assert reports[1]["connascence"]["success"] is False
+        assert reports[2]["connascence"] == reports[0]["connascence"]
+
+    def test_empty_batch(self):
+        """An empty batch should return an empty list."""
+        assert analyze_artifacts([]) == []
+
+    def test_single_artifact_matches_batch(self, tmp_path):
+        """analyze_artifact() should match the batch API for one path."""
+        source = tmp_path / "sample.py"
+        source.write_text(SAMPLE_SOURCE)
+
+        single = analyze_artifact(source, policy="strict")
+        batch = analyze_artifacts([source], policy="strict")[0]
+
+        assert single["policy"] == batch["policy"] == "strict"
+        assert single["connascence"] == batch["connascence"]
+
+
+class TestConnascenceResult:
+    """Tests for ConnascenceResult."""
+
+    def test_failed_result_never_passes(self):
+        """Unsuccessful results fail both gates."""
+        result = ConnascenceResult(success=False, error="boom")
+        assert not result.passes_gate(strict=False)
+        assert not result.passes_gate(strict=True)
+
+    def test_results_are_immutable(self):
+        """Results are frozen so cached instances can be shared safely."""
+        import dataclasses
+
+        result = ConnascenceResult(success=True, violations_count=1)
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            result.violations_count = 2
+        assert not hasattr(result, "__dict__")
+
+    def test_to_dict_includes_gates(self):
+        """to_dict() should include both gate outcomes."""
+        result = ConnascenceResult(
+            success=True,
+            sigma_level=5.0,
+            dpmo=100,
+            nasa_compliance=1.0,
+            mece_score=0.9,
+            theater_risk=0.0,
+        )
+        d = result.to_dict()
+        assert d["passes_strict"] is True
+        assert d["passes_lenient"] is True
+        assert d["error"] is None
@@ -90,6 +90,16 @@ class TestHarnessAuthority:
             assert "epistemic_consistency" in metrics, "Must have epistemic_consistency"
             assert "overall" in metrics, "Must have overall score"
 
+    def test_grade_content_matches_file_grading(self):
+        """In-memory grading should score text exactly like grade()."""
+        content = "This is a test artifact with [assert|confident] VERIX markers"
+        with tempfile.TemporaryDirectory() as tmpdir:
+            harness = FrozenHarness(Path(tmpdir), use_cli_evaluator=False, use_connascence=False)
+            artifact_path = Path(tmpdir) / "test_artifact.txt"
+            artifact_path.write_text(content)
+
+            assert harness.grade_content(content) == harness.grade(artifact_path)
+
     def test_bridge_rejects_model_reported_metrics(self):
         """Verify bridge rejects history entries with model-reported metrics."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -0,0 +1,484 @@
+"""
+Tests for loopctl/core.py
+
+Tests:
+- Emergency stop kill switch and its probe cache
+- Artifact lookup and its probe cache
+- Policy reuse until policy.json changes
+- Loop state reset
+- Memoized harness integrity hash
+- Per-loop-directory harness and bridge caches
+- Once-per-process CLI evaluator probe
+- Grading from pre-read artifact bytes
+- Heuristic graders
+- Streamed file hashing
+- Git HEAD lookup from repository files
+- Lazy CLI evaluator and Connascence bridge
+- Loop state JSON helpers
+"""
+
+import os
+import sys
+import pytest
+from pathlib import Path
+
+# Add parent path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from loopctl import core
+from loopctl.core import FrozenHarness, check_emergency_stop
+from integration.unified_bridge import UnifiedBridge
+
+
+class TestEmergencyStop:
+    """Tests for check_emergency_stop and its TTL cache."""
+
+    @pytest.fixture(autouse=True)
+    def isolated(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.delenv("META_LOOP_EMERGENCY_STOP", raising=False)
+        monkeypatch.setattr(core, "_HOME_STOP_FILE", tmp_path / "home-stop")
+        monkeypatch.setattr(core, "_PLUGIN_STOP_FILE", tmp_path / "plugin-stop")
+        core._emergency_cache.clear()
+        yield
+        core._emergency_cache.clear()
+
+    def test_no_signal(self):
+        """Without kill switches the loop may continue."""
+        assert check_emergency_stop() == (False, "")
+
+    def test_cwd_stop_file(self, tmp_path):
+        """A stop file in the working directory halts the loop."""
+        (tmp_path / ".meta-loop-stop").touch()
+        should_stop, reason = check_emergency_stop()
+        assert should_stop
+        assert "current directory" in reason
+
+    def test_env_var_is_never_cached(self, monkeypatch):
+        """The environment switch takes effect even while file probes are cached."""
+        assert check_emergency_stop() == (False, "")
+        monkeypatch.setenv("META_LOOP_EMERGENCY_STOP", "true")
+        assert check_emergency_stop()[0]
+
+    def test_file_probes_are_cached_within_ttl(self, tmp_path, monkeypatch):
+        """Repeated checks within the TTL reuse the probe result."""
+        assert check_emergency_stop() == (False, "")
+        (tmp_path / ".meta-loop-stop").touch()
+        assert check_emergency_stop() == (False, "")
+
+        monkeypatch.setattr(core, "_EMERGENCY_TTL", 0.0)
+        assert check_emergency_stop()[0]
+
+
+class TestFindArtifact:
+    """Tests for find_artifact and its TTL cache."""
+
+    @pytest.fixture(autouse=True)
+    def isolated(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        core._artifact_cache.clear()
+        yield
+        core._artifact_cache.clear()
+
+    def test_explicit_output_path_wins(self, tmp_path):
+        """An explicit output path is returned as-is."""
+        assert core.find_artifact("out.md", tmp_path) == Path("out.md")
+
+    def test_candidate_order_and_missing_fallback(self, tmp_path):
+        """The first existing candidate is used; a miss is not cached."""
+        loop_dir = tmp_path / ".loop"
+        loop_dir.mkdir()
+        assert core.find_artifact(None, loop_dir) == loop_dir / "output" / "latest.txt"
+
+        (loop_dir / "output.txt").write_text("x")
+        assert core.find_artifact(None, loop_dir) == loop_dir / "output.txt"
+
+    def test_hits_are_cached_within_ttl(self, tmp_path, monkeypatch):
+        """A found artifact is reused, without re-probing, until the TTL expires."""
+        loop_dir = tmp_path / ".loop"
+        (loop_dir / "output").mkdir(parents=True)
+        (loop_dir / "output.txt").write_text("x")
+        assert core.find_artifact(None, loop_dir) == loop_dir / "output.txt"
+
+        (loop_dir / "output.txt").unlink()
+        assert core.find_artifact(None, loop_dir) == loop_dir / "output.txt"
+
+        monkeypatch.setattr(core, "_ARTIFACT_TTL", 0.0)
+        assert core.find_artifact(None, loop_dir) == loop_dir / "output" / "latest.txt"
+
+    def test_higher_priority_artifact_beats_cached_hit(self, tmp_path):
+        """An artifact written after a lower-priority hit wins immediately."""
+        loop_dir = tmp_path / ".loop"
+        (loop_dir / "output").mkdir(parents=True)
+        (loop_dir / "output.txt").write_text("x")
+        assert core.find_artifact(None, loop_dir) == loop_dir / "output.txt"
+
+        (loop_dir / "output" / "latest.txt").write_text("y")
+        assert core.find_artifact(None, loop_dir) == loop_dir / "output" / "latest.txt"
+
+
+class TestPolicyCache:
+    """Tests for reusing the parsed policy between iterations."""
+
+    def test_policy_reparsed_only_when_file_changes(self, tmp_path):
+        """An unchanged policy.json is parsed once; edits are picked up."""
+        bridge = UnifiedBridge(tmp_path)
+        assert bridge.load_policy() == {"regression_threshold": 0.03, "max_iterations": 50}
+
+        policy_path = tmp_path / "policy.json"
+        policy_path.write_text('{"max_iterations": 5}')
+        first = bridge.load_policy()
+        assert first == {"max_iterations": 5}
+        assert bridge.load_policy() is first
+
+        policy_path.write_text('{"max_iterations": 12}')
+        os.utime(policy_path, ns=(0, 10**18))
+        assert bridge.load_policy() == {"max_iterations": 12}
+
+
+class TestResetLoop:
+    """Tests for reset_loop."""
+
+    def test_writes_default_config_and_empty_history(self, tmp_path):
+        """Both state files are rewritten with their defaults."""
+        (tmp_path / "history.json").write_text('{"iterations": [{"score": 0.5}]}')
+
+        assert core.reset_loop(str(tmp_path))["status"] == "reset"
+
+        config = core._loads_json((tmp_path / "runtime_config.json").read_bytes())
+        history = core._loads_json((tmp_path / "history.json").read_bytes())
+        assert config["mode"] == "balanced"
+        assert config["_comment"] == "CONTROL INPUT - Reset by loopctl"
+        assert history["iterations"] == []
+
+    def test_write_errors_propagate(self, tmp_path):
+        """A failed write is reported, not swallowed by the worker thread."""
+        (tmp_path / "history.json").mkdir()
+        with pytest.raises(IsADirectoryError):
+            core.reset_loop(str(tmp_path))
+
+
+class TestHarnessHash:
+    """Tests for the memoized harness integrity hash."""
+
+    def test_hash_is_stable_across_instances(self, tmp_path):
+        """Every harness over the same source reports the same hash."""
+        first = FrozenHarness(tmp_path, use_cli_evaluator=False, use_connascence=False)
+        second = FrozenHarness(tmp_path, use_cli_evaluator=False, use_connascence=False)
+        assert first.current_hash == second.current_hash
+        assert first.current_hash.startswith("frozen_eval_harness_v1.0.0_")
+
+    def test_hash_is_memoized_per_mtime(self, tmp_path):
+        """The source is re-read only when its mtime changes."""
+        source = tmp_path / "harness.py"
+        source.write_text("v1")
+        core._harness_file_hash.cache_clear()
+
+        first = core._harness_file_hash(str(source), 1, "1.0.0")
+        source.write_text("v2")
+        cached = core._harness_file_hash(str(source), 1, "1.0.0")
+        changed = core._harness_file_hash(str(source), 2, "1.0.0")
+
+        assert cached == first
+        assert changed != first
+
+
+class TestPerLoopCaches:
+    """Tests for the per-loop-directory harness and bridge caches."""
+
+    def test_harness_is_reused_per_loop_dir(self, tmp_path, monkeypatch):
+        """Equivalent loop_dir spellings share one harness."""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(core, "_HARNESS_CACHE", {})
+        (tmp_path / ".loop").mkdir()
+
+        first = core._get_harness(Path(".loop"))
+        second = core._get_harness(tmp_path / ".loop")
+
+        assert first is second
+        assert core._get_harness(tmp_path / "other") is not first
+
+    def test_cached_objects_use_resolved_paths(self, tmp_path, monkeypatch):
+        """A relative loop_dir is pinned to its absolute path before caching."""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(core, "_HARNESS_CACHE", {})
+        monkeypatch.setattr(core, "_BRIDGE_CACHE", {})
+        (tmp_path / ".loop").mkdir()
+
+        harness = core._get_harness(Path(".loop"))
+        bridge = core._get_bridge(Path(".loop"))
+        monkeypatch.chdir(tmp_path.parent)
+
+        assert harness.loop_dir == tmp_path.resolve() / ".loop"
+        assert bridge.config_path == tmp_path.resolve() / ".loop" / "runtime_config.json"
+
+    def test_cached_harness_is_rehashed_after_edit(self, tmp_path, monkeypatch):
+        """A harness edit seen mid-process changes the cached harness's hash."""
+        source = tmp_path / "harness.py"
+        source.write_text("v1")
+        monkeypatch.setattr(core, "_MODULE_PATH", str(source))
+        monkeypatch.setattr(core, "_HARNESS_CACHE", {})
+        core._harness_file_hash.cache_clear()
+
+        harness = core._get_harness(tmp_path)
+        before = harness.current_hash
+        source.write_text("v2")
+        stat = source.stat()
+        os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert core._get_harness(tmp_path) is harness
+        assert harness.current_hash != before
+        assert not harness.verify_integrity(before)
+
+    def test_bridge_is_reused_per_loop_dir(self, tmp_path, monkeypatch):
+        """Repeated lookups return the same UnifiedBridge."""
+        monkeypatch.setattr(core, "_BRIDGE_CACHE", {})
+        assert core._get_bridge(tmp_path) is core._get_bridge(tmp_path)
+
+
+class TestCliEvaluatorProbe:
+    """Tests for the once-per-process CLI evaluator probe."""
+
+    def test_probe_runs_once(self, tmp_path, monkeypatch):
+        """Constructing many harnesses probes the CLI only once."""
+        probes = []
+
+        class FakeCLI:
+            @property
+            def is_available(self):
+                probes.append(1)
+                return False
+
+        monkeypatch.setattr(core, "ClaudeCLI", FakeCLI)
+        core._available_cli_evaluator.cache_clear()
+        try:
+            for _ in range(3):
+                harness = FrozenHarness(tmp_path, use_connascence=False)
+                assert harness.evaluation_mode == "heuristic"
+        finally:
+            core._available_cli_evaluator.cache_clear()
+
+        assert len(probes) == 1
+
+    def test_cli_scores_weighting(self, tmp_path):
+        """The judge's scores are weighted 0.4/0.2/0.2/0.2; missing ones count as 0.5."""
+        class FakeJudge:
+            def send_message(self, prompt, max_tokens):
+                return {"response": 'Scores: {"task_accuracy": 1.0, "edge_robustness": 0.0}'}
+
+        harness = FrozenHarness(tmp_path, use_cli_evaluator=False, use_connascence=False)
+        harness.__dict__["_cli_evaluator"] = FakeJudge()
+
+        scores = harness._grade_with_cli("content")
+        assert scores["overall"] == pytest.approx(0.4 + 0.1 + 0.0 + 0.1)
+
+    @pytest.mark.parametrize("length", [0, 2999, 3000, 3001, 100_000])
+    def test_judge_prompt_truncates_content(self, tmp_path, length):
+        """The judge sees the first 3000 characters inside the fixed template."""
+        prompts = []
+
+        class FakeJudge:
+            def send_message(self, prompt, max_tokens):
+                prompts.append(prompt)
+                return {"response": "{}"}
+
+        harness = FrozenHarness(tmp_path, use_cli_evaluator=False, use_connascence=False)
+        harness.__dict__["_cli_evaluator"] = FakeJudge()
+        content = "".join(chr(97 + i % 26) for i in range(length))
+        harness._grade_with_cli(content)
+
+        assert prompts[0] == (
+            core._JUDGE_PROMPT_HEADER + content[:3000] + core._JUDGE_PROMPT_FOOTER
+        )
+        assert prompts[0].endswith('"epistemic_consistency": 0.0}')
+
+
+class TestGradePreRead:
+    """Tests for grading from bytes the caller already read."""
+
+    @pytest.mark.parametrize("raw", [
+        b"[assert|confident] done\r\nerror handling\r\n" * 20,
+        "café [conf:0.9] edge case".encode(),
+        b"",
+    ])
+    def test_bytes_match_file_grading(self, tmp_path, raw):
+        """Pre-read bytes grade exactly like reading the file."""
+        harness = FrozenHarness(tmp_path, use_cli_evaluator=False, use_connascence=False)
+        artifact = tmp_path / "artifact.txt"
+        artifact.write_bytes(raw)
+
+        assert harness.grade(artifact, content_bytes=raw) == harness.grade(artifact)
+
+
+class TestHeuristicGraders:
+    """Tests for the heuristic graders."""
+
+    @pytest.fixture
+    def harness(self, tmp_path):
+        return FrozenHarness(tmp_path, use_cli_evaluator=False, use_connascence=False)
+
+    def test_markers_are_case_insensitive_and_counted_once(self, harness):
+        """Each marker counts once, however often and in whatever case it appears."""
+        content = "ERROR error Error [CONF:0.9] [conf:0.8] Edge Case"
+        assert harness._grade_robustness(content) == pytest.approx(0.7)
+        assert harness._grade_epistemic(content) == pytest.approx(0.5)
+
+    def test_accuracy_completion_markers(self, harness):
+        """Completion markers lift accuracy for non-trivial content."""
+        filler = "x" * 120
+        assert harness._grade_accuracy(filler) == 0.6
+        assert harness._grade_accuracy(filler + " [WITNESSED]") == 0.8
+
+    def test_shared_marker_scan_matches_per_grader_scan(self, harness):
+        """Passing one precomputed marker set gives the same grades."""
+        content = "[ASSERT|x] [ground:doc] handles the Boundary and Validation " * 5
+        markers = core._find_markers(content.lower())
+        assert markers == {"[assert", "[ground:", "boundary", "validation"}
+        assert harness._grade_accuracy(content, markers) == harness._grade_accuracy(content)
+        assert harness._grade_robustness(content, markers) == harness._grade_robustness(content)
+        assert harness._grade_epistemic(content, markers) == harness._grade_epistemic(content)
+
+    def test_empty_content_scores_match_graders(self, harness):
+        """The empty-content shortcut returns what the graders would."""
+        scores = harness._grade_with_heuristics("")
+        assert scores["task_accuracy"] == harness._grade_accuracy("")
+        assert scores["token_efficiency"] == harness._grade_efficiency("")
+        assert scores["edge_robustness"] == harness._grade_robustness("")
+        assert scores["epistemic_consistency"] == harness._grade_epistemic("")
+        assert scores["overall"] == pytest.approx(0.36)
+
+    @pytest.mark.parametrize("words,score", [
+        (0, 0.9), (49, 0.9), (50, 0.8), (199, 0.8), (200, 0.7),
+        (499, 0.7), (500, 0.5), (501, 0.5), (5000, 0.5),
+    ])
+    def test_efficiency_buckets(self, harness, words, score):
+        """Word-count buckets are exact at every boundary."""
+        assert harness._grade_efficiency(" \n".join(["w"] * words)) == score
+
+
+class TestFileHashing:
+    """Tests for streamed file hashing."""
+
+    def test_streamed_hash_matches_whole_file_hash(self, tmp_path, monkeypatch):
+        """Both the file_digest and chunked paths match hashing the bytes."""
+        import hashlib
+
+        data = bytes(range(256)) * 5000
+        source = tmp_path / "blob.bin"
+        source.write_bytes(data)
+        expected = hashlib.sha256(data).hexdigest()
+
+        assert core._sha256_file(source) == expected
+        monkeypatch.delattr(hashlib, "file_digest", raising=False)
+        assert core._sha256_file(source, chunk_size=4096) == expected
+
+
+class TestGitHead:
+    """Tests for reading HEAD straight from the repository files."""
+
+    SHA = "0123456789abcdef0123456789abcdef01234567"
+
+    @pytest.fixture
+    def repo(self, tmp_path, monkeypatch):
+        git_dir = tmp_path / ".git"
+        (git_dir / "refs" / "heads").mkdir(parents=True)
+        (tmp_path / "sub").mkdir()
+        monkeypatch.chdir(tmp_path / "sub")
+        monkeypatch.setattr(core, "_git_dir_cache", {})
+        return git_dir
+
+    def test_branch_ref(self, repo):
+        """A symbolic HEAD is resolved through its loose ref file."""
+        (repo / "HEAD").write_text("ref: refs/heads/main\n")
+        (repo / "refs" / "heads" / "main").write_text(self.SHA + "\n")
+        assert core.get_git_head() == self.SHA[:7]
+
+    def test_packed_ref(self, repo):
+        """Refs that only exist in packed-refs are found there."""
+        (repo / "HEAD").write_text("ref: refs/heads/main\n")
+        (repo / "packed-refs").write_text(
+            "# pack-refs with: peeled fully-peeled sorted\n"
+            f"{self.SHA} refs/heads/main\n"
+        )
+        assert core.get_git_head() == self.SHA[:7]
+
+    def test_detached_head(self, repo):
+        """A detached HEAD holds the commit hash itself."""
+        (repo / "HEAD").write_text(self.SHA + "\n")
+        assert core.get_git_head() == self.SHA[:7]
+
+    def test_outside_repository(self, tmp_path, monkeypatch):
+        """Directories outside any repository have no HEAD."""
+        monkeypatch.setattr(core, "_find_git_dir", lambda: None)
+        assert core.get_git_head() is None
+
+
+class TestLazyHarnessComponents:
+    """Tests for on-demand creation of the CLI evaluator and Connascence bridge."""
+
+    def test_bridge_is_created_on_first_grade(self, tmp_path, monkeypatch):
+        """Construction and grading a missing artifact never build the bridge."""
+        created = []
+        monkeypatch.setattr(
+            FrozenHarness, "_init_connascence_bridge",
+            lambda self: created.append(1) or None,
+        )
+        harness = FrozenHarness(tmp_path, use_cli_evaluator=False)
+        harness.grade(tmp_path / "missing.txt")
+        assert created == []
+
+        artifact = tmp_path / "artifact.txt"
+        artifact.write_text("output")
+        harness.grade(artifact)
+        harness.grade(artifact)
+        assert created == [1]
+
+    def test_disabled_components_stay_none(self, tmp_path):
+        """Disabled components are never initialized."""
+        harness = FrozenHarness(tmp_path, use_cli_evaluator=False, use_connascence=False)
+        assert harness._cli_evaluator is None
+        assert harness.connascence_mode == "disabled"
+
+
+class TestJsonHelpers:
+    """Tests for the loop state JSON helpers."""
+
+    def test_dumps_matches_stdlib_layout(self):
+        """Output round-trips and matches json.dumps(indent=2)."""
+        import json
+
+        obj = {"iteration": 3, "metrics": {"overall": 0.75}, "reasons": [], "ok": True}
+        data = core._dumps_json(obj)
+
+        assert data == json.dumps(obj, indent=2).encode()
+        assert core._loads_json(data) == obj
+
+    def test_non_ascii_is_escaped(self):
+        """Files stay ASCII so locale-encoding readers decode them correctly."""
+        data = core._dumps_json({"artifact_path": "café.txt"})
+        assert data.isascii()
+        assert core._loads_json(data) == {"artifact_path": "café.txt"}
+
+    def test_compact_matches_stdlib_layout(self):
+        """Compact output matches json.dumps with no separator whitespace."""
+        import json
+
+        obj = {"metrics": {"overall": 0.75}, "reasons": ["a b"], "path": "café"}
+        assert core._dumps_json(obj, indent=False) == json.dumps(obj, separators=(",", ":")).encode()
+
+    def test_atomic_write_replaces_file(self, tmp_path):
+        """The target is replaced whole and no temp file is left behind."""
+        target = tmp_path / "eval_report.json"
+        target.write_text("stale")
+
+        core._write_json_atomic(target, {"iteration": 2}, indent=False)
+
+        assert target.read_bytes() == b'{"iteration":2}'
+        assert [p.name for p in tmp_path.iterdir()] == ["eval_report.json"]
+
+    def test_debug_flag(self, monkeypatch):
+        """Pretty report copies are only requested via META_LOOP_DEBUG_JSON."""
+        monkeypatch.delenv("META_LOOP_DEBUG_JSON", raising=False)
+        assert core._debug_json_enabled() is False
+        monkeypatch.setenv("META_LOOP_DEBUG_JSON", "1")
+        assert core._debug_json_enabled() is True
@@ -0,0 +1,50 @@
+"""
+Tests for optimization/mcp_client.py
+
+Tests:
+- Batched memory_store: result order and same-key write order
+"""
+
+import os
+import sys
+import json
+import pytest
+
+# Add parent path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from optimization.mcp_client import MemoryMCPClient
+
+
+class TestMemoryStoreBatch:
+    """Tests for MemoryMCPClient.memory_store_batch."""
+
+    @pytest.fixture
+    def client(self, tmp_path):
+        client = MemoryMCPClient(namespace="test", fallback_dir=tmp_path)
+        client._mcp_available = False
+        client._last_check_time = float("inf")
+        return client
+
+    def test_results_align_with_entries(self, client):
+        """Each entry gets its own result, in entry order."""
+        entries = [(f"k{i}", {"i": i}, {"WHO": "test"}) for i in range(20)]
+        results = client.memory_store_batch(entries)
+
+        assert len(results) == 20
+        assert all(r.success for r in results)
+        assert [r.data["key"] for r in results] == [f"test/k{i}" for i in range(20)]
+
+    def test_last_entry_for_a_key_wins(self, client, tmp_path):
+        """Entries sharing a key are stored in order, as sequential calls would."""
+        entries = [("mode", {"v": v}, {"WHO": "test"}) for v in range(10)]
+        entries += [(f"other{i}", {"v": i}, None) for i in range(10)]
+
+        assert all(r.success for r in client.memory_store_batch(entries))
+
+        stored = json.loads((tmp_path / "test_mode.json").read_text())
+        assert stored["value"] == {"v": 9}
+
+    def test_empty_batch(self, client):
+        """An empty batch stores nothing."""
+        assert client.memory_store_batch([]) == []
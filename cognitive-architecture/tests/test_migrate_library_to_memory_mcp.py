@@ -0,0 +1,144 @@
+"""
+Tests for scripts/migrate_library_to_memory_mcp.py
+
+Tests:
+- Full Tier 1 migration: stored keys, values, metadata and counts
+- Large (memory-mapped) library files and null-bearing mode configs
+- Errors from unreadable eval files are counted and logged with their path
+"""
+
+import os
+import sys
+import json
+import pytest
+
+# Add parent path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from optimization.mcp_client import MemoryMCPClient
+from scripts import migrate_library_to_memory_mcp as migrate
+
+
+NAMESPACE = "cognitive-architecture/library"
+
+
+def write_json(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data), encoding="utf-8")
+
+
+@pytest.fixture
+def library(tmp_path):
+    """A small library with one malformed eval and one large frontier."""
+    root = tmp_path / "library"
+    storage = root / "storage"
+
+    write_json(storage / "real_optimization" / "named_modes.json", {
+        "modes": {
+            "audit": {"frames": ["evidential"], "score": 0.9},
+            "speed": {"frames": [], "score": 0.7, "notes": None},
+        },
+    })
+    write_json(storage / "two_stage_optimization" / "named_modes.json", {
+        "balanced": {"frames": ["aspectual"], "score": 0.8},
+    })
+    write_json(storage / "real_optimization" / "pareto_frontier.json", {
+        "solutions": [
+            {"id": i, "accuracy": 0.5 + i / 10000, "config": {"frames": ["evidential"] * 4}}
+            for i in range(1000)
+        ],
+    })
+    write_json(root / "integration" / "metaloop_optimization_results.json", [
+        {"iteration": 1, "score": 0.6},
+        {"iteration": 2, "score": 0.7},
+    ])
+    write_json(storage / "policy.json", {"regression_threshold": 0.05, "max_iterations": 10})
+
+    evals = storage / "eval_results"
+    write_json(evals / "prompt-architect-cli-eval-20260101-171411.json", {"overall": 0.82})
+    (evals / "skill-forge-eval-20260101-185723.json").write_text("{not json", encoding="utf-8")
+    return root
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    client = MemoryMCPClient(namespace=NAMESPACE, fallback_dir=tmp_path / "memory")
+    client._mcp_available = False
+    client._last_check_time = float("inf")
+    monkeypatch.setattr(migrate, "get_mcp_client", lambda namespace: client)
+    return client
+
+
+def stored(client, key):
+    """Read back the fallback record for a migrated key."""
+    safe_key = f"{NAMESPACE}/{key}".replace("/", "_").replace(":", "_")
+    return json.loads((client.fallback_dir / f"{safe_key}.json").read_text())
+
+
+class TestMigrateAllTier1:
+    """Tests for LibraryMigrator.migrate_all_tier1."""
+
+    def test_counts_and_error_log(self, library, client):
+        """Every category is migrated; the bad eval is counted and logged."""
+        migrator = migrate.LibraryMigrator(library)
+        results = migrator.migrate_all_tier1()
+
+        migrations = results["migrations"]
+        assert migrations["named_modes"] == {"stored_count": 3, "error_count": 0}
+        assert migrations["metaloop_results"] == {"stored_count": 1, "error_count": 0}
+        assert migrations["policy"] == {"stored_count": 1, "error_count": 0}
+        assert migrations["pareto_frontier"] == {"stored_count": 1, "error_count": 0}
+        assert migrations["eval_results"] == {"stored_count": 1, "error_count": 1}
+        assert results["summary"]["total_stored"] == 7
+        assert results["summary"]["total_errors"] == 1
+
+        bad = library / "storage" / "eval_results" / "skill-forge-eval-20260101-185723.json"
+        assert len(migrator.migration_log) == 1
+        assert migrator.migration_log[0].startswith(f"Error processing {bad}: ")
+
+    def test_stored_values_and_metadata(self, library, client):
+        """Stored values round-trip, and every entry carries the run's WHEN."""
+        results = migrate.LibraryMigrator(library).migrate_all_tier1()
+        when = results["timestamp"]
+
+        audit = stored(client, "named_modes/audit")
+        assert audit["value"] == {"frames": ["evidential"], "score": 0.9}
+        assert audit["metadata"]["WHO"] == "library-migrator:named_modes"
+        assert audit["metadata"]["WHEN"] == when
+        assert audit["metadata"]["x-source-file"] == "named_modes.json"
+        # null values take the stdlib serialization path and still round-trip
+        assert stored(client, "named_modes/speed")["value"]["notes"] is None
+        assert stored(client, "named_modes/balanced")["value"]["score"] == 0.8
+
+        metaloop = stored(client, "metaloop/optimization_results")
+        assert metaloop["value"]["iterations"][1] == {"iteration": 2, "score": 0.7}
+        assert metaloop["metadata"]["x-iterations"] == "2"
+
+        policy = stored(client, "governance/policy")
+        assert policy["metadata"]["x-regression-threshold"] == "0.05"
+        assert policy["metadata"]["x-max-iterations"] == "10"
+
+        evaluation = stored(client, "evaluations/prompt-architect-cli-eval-20260101-171411")
+        assert evaluation["value"] == {"overall": 0.82}
+        assert evaluation["metadata"]["x-skill"] == "prompt-architect"
+        assert evaluation["metadata"]["WHEN"] == when
+
+    def test_large_file_is_read_through_mmap(self, library, client, monkeypatch):
+        """Files of at least _MMAP_MIN_BYTES parse to the same frontier."""
+        path = library / "storage" / "real_optimization" / "pareto_frontier.json"
+        assert path.stat().st_size >= migrate._MMAP_MIN_BYTES
+        mapped = []
+        original_mmap = migrate.mmap.mmap
+
+        def recording_mmap(*args, **kwargs):
+            mapped.append(args)
+            return original_mmap(*args, **kwargs)
+
+        monkeypatch.setattr(migrate.mmap, "mmap", recording_mmap)
+        migrate.LibraryMigrator(library).migrate_all_tier1()
+
+        frontier = stored(client, "optimization/pareto_frontier_real_optimization")
+        assert frontier["value"] == json.loads(path.read_text())
+        assert frontier["metadata"]["x-solutions-count"] == "1000"
+        if migrate._orjson is not None:
+            assert len(mapped) == 1